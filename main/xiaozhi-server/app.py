@@ -145,7 +145,19 @@ async def main():
         print("服务器已关闭，程序退出。")
 
 
+def install_event_loop_policy():
+    """非 Windows 平台优先使用 uvloop 事件循环，降低任务调度开销；未安装时使用默认事件循环"""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    install_event_loop_policy()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,7 +1,13 @@
 import os
+import sys
+import copy
 import asyncio
+import threading
+import functools
 import yaml
+from collections import OrderedDict
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from config.manage_api_client import (
     init_service,
     get_server_config,
@@ -11,16 +17,42 @@ from config.manage_api_client import (
     DeviceBindException,
 )
 
+# 优先使用基于libyaml的C解析器，未安装libyaml时回退到纯Python实现
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+# 已解析配置文件的LRU缓存，键为(绝对路径, 修改时间, 文件大小)，文件变化后自动失效
+_READ_CONFIG_CACHE_SIZE = 16
+_read_config_cache = OrderedDict()
+_read_config_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_dir():
     """获取项目根目录"""
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + "/"
 
 
 def read_config(config_path):
-    with open(config_path, "r", encoding="utf-8") as file:
-        config = yaml.safe_load(file)
-    return config
+    """读取YAML配置文件，文件未变化时直接返回缓存的解析结果（深拷贝）"""
+    abs_path = os.path.abspath(config_path)
+    st = os.stat(abs_path)
+    cache_key = (abs_path, st.st_mtime_ns, st.st_size)
+
+    with _read_config_lock:
+        cached = _read_config_cache.get(cache_key)
+        if cached is not None:
+            _read_config_cache.move_to_end(cache_key)
+
+    if cached is None:
+        with open(abs_path, "r", encoding="utf-8") as file:
+            cached = yaml.load(file, Loader=_YAML_LOADER)
+        with _read_config_lock:
+            _read_config_cache[cache_key] = cached
+            while len(_read_config_cache) > _READ_CONFIG_CACHE_SIZE:
+                _read_config_cache.popitem(last=False)
+
+    # 调用方会修改返回的配置，因此返回副本，避免污染缓存
+    return copy.deepcopy(cached)
 
 
 async def load_config():
@@ -44,6 +76,8 @@ async def load_config():
     else:
         # 合并配置
         config = merge_configs(default_config, custom_config)
+    # 合并后的配置常驻内存，驻留重复的字符串以减少占用
+    intern_config_strings(config)
     # 初始化目录
     ensure_directories(config)
 
@@ -52,6 +86,25 @@ async def load_config():
     return config
 
 
+def load_config_sync():
+    """在同步代码中加载配置，异步代码请直接 await load_config()"""
+    from core.utils.cache.manager import cache_manager, CacheType
+
+    cached_config = cache_manager.get(CacheType.CONFIG, "main_config")
+    if cached_config is not None:
+        return cached_config
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # 当前线程没有运行中的事件循环，直接运行
+        return asyncio.run(load_config())
+
+    # 当前线程已有运行中的事件循环，不能在其上阻塞等待，改为在独立线程的新循环中加载
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, load_config()).result()
+
+
 async def get_config_from_api_async(config):
     """从Java API获取配置（异步版本）"""
     # 初始化API客户端
@@ -114,39 +167,67 @@ def ensure_directories(config):
     log_dir = config.get("log", {}).get("log_dir", "tmp")
     dirs_to_create.add(os.path.join(project_dir, log_dir))
 
-    # ASR/TTS模块输出目录
-    for module in ["ASR", "TTS"]:
-        if config.get(module) is None:
-            continue
-        for provider in config.get(module, {}).values():
-            output_dir = provider.get("output_dir", "")
-            if output_dir:
-                dirs_to_create.add(output_dir)
+    # 单次遍历各模块：ASR/TTS收集所有provider的输出目录，ASR/LLM/TTS额外收集已选provider的模型目录
+    selected_modules = config.get("selected_module") or {}
+    for module_type in ("ASR", "LLM", "TTS"):
+        section = config.get(module_type) or {}
+        if module_type != "LLM":
+            for provider_config in section.values():
+                output_dir = provider_config.get("output_dir")
+                if output_dir:
+                    dirs_to_create.add(output_dir)
 
-    # 根据selected_module创建模型目录
-    selected_modules = config.get("selected_module", {})
-    for module_type in ["ASR", "LLM", "TTS"]:
         selected_provider = selected_modules.get(module_type)
-        if not selected_provider:
-            continue
-        if config.get(module_type) is None:
-            continue
-        if config.get(selected_provider) is None:
-            continue
-        provider_config = config.get(module_type, {}).get(selected_provider, {})
-        output_dir = provider_config.get("output_dir")
-        if output_dir:
-            full_model_dir = os.path.join(project_dir, output_dir)
-            dirs_to_create.add(full_model_dir)
+        provider_config = section.get(selected_provider) if selected_provider else None
+        if provider_config:
+            output_dir = provider_config.get("output_dir")
+            if output_dir:
+                dirs_to_create.add(os.path.join(project_dir, output_dir))
 
     # 统一创建目录（保留原data目录创建）
     for dir_path in dirs_to_create:
+        # 已存在的目录无需再调用makedirs逐级检查
+        if os.path.isdir(dir_path):
+            continue
         try:
             os.makedirs(dir_path, exist_ok=True)
         except PermissionError:
             print(f"警告：无法创建目录 {dir_path}，请检查写入权限")
 
 
+def intern_config_strings(config, max_value_length=64):
+    """
+    原地驻留配置中的字符串键和较短的字符串值，使重复出现的模块名、provider名等共享同一对象
+
+    Args:
+        config: 配置字典
+        max_value_length: 仅驻留长度不超过该值的字符串值，避免驻留提示词等长文本
+    """
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = list(node.items())
+            node.clear()
+            for key, value in items:
+                if isinstance(key, str):
+                    key = sys.intern(key)
+                if isinstance(value, str):
+                    if len(value) <= max_value_length:
+                        value = sys.intern(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+                node[key] = value
+        elif isinstance(node, list):
+            for i, value in enumerate(node):
+                if isinstance(value, str):
+                    if len(value) <= max_value_length:
+                        node[i] = sys.intern(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+    return config
+
+
 def merge_configs(default_config, custom_config):
     """
     递归合并配置，custom_config优先级更高
@@ -165,14 +246,17 @@ def merge_configs(default_config, custom_config):
 
     merged = dict(default_config)
 
-    for key, value in custom_config.items():
-        if (
-            key in merged
-            and isinstance(merged[key], Mapping)
-            and isinstance(value, Mapping)
-        ):
-            merged[key] = merge_configs(merged[key], value)
-        else:
-            merged[key] = value
+    # 使用显式栈代替递归，仅对需要合并的层级做浅拷贝，不修改传入的配置
+    stack = [(merged, custom_config)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, Mapping) and isinstance(value, Mapping):
+                current = dict(current)
+                target[key] = current
+                stack.append((current, value))
+            else:
+                target[key] = value
 
     return merged
@@ -1,20 +1,25 @@
 import os
 import sys
-import asyncio
+import functools
 from loguru import logger
-from config.config_loader import load_config
+from config.config_loader import load_config_sync
 from config.settings import check_config_file
-from core.utils.cache.manager import cache_manager, CacheType
 
 SERVER_VERSION = "0.9.6"
 _logger_initialized = False
 
+# 模块字符串中各模块的顺序
+_MODULE_STRING_ORDER = ("VAD", "ASR", "LLM", "TTS", "Memory", "Intent", "VLLM")
+
 
 def get_module_abbreviation(module_name, module_dict):
     """获取模块名称的缩写，如果为空则返回00
     如果名称中包含下划线，则返回下划线后面的前两个字符
     """
-    module_value = module_dict.get(module_name, "")
+    return _abbreviate_module_value(module_dict.get(module_name, ""))
+
+
+def _abbreviate_module_value(module_value):
     if not module_value:
         return "00"
     if "_" in module_value:
@@ -25,17 +30,17 @@ def get_module_abbreviation(module_name, module_dict):
 
 def build_module_string(selected_module):
     """构建模块字符串"""
-    return (
-        get_module_abbreviation("VAD", selected_module)
-        + get_module_abbreviation("ASR", selected_module)
-        + get_module_abbreviation("LLM", selected_module)
-        + get_module_abbreviation("TTS", selected_module)
-        + get_module_abbreviation("Memory", selected_module)
-        + get_module_abbreviation("Intent", selected_module)
-        + get_module_abbreviation("VLLM", selected_module)
+    # 各连接选用的模块组合很少，按模块名组合缓存结果，避免每个连接重复拆分拼接
+    return _build_module_string_cached(
+        tuple(selected_module.get(name, "") for name in _MODULE_STRING_ORDER)
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _build_module_string_cached(module_values):
+    return "".join(_abbreviate_module_value(value) for value in module_values)
+
+
 def formatter(record):
     """为没有 tag 的日志添加默认值，并处理动态模块字符串"""
     record["extra"].setdefault("tag", record["name"])
@@ -48,15 +53,16 @@ def formatter(record):
 
 def setup_logging(config=None):
     """从配置文件中读取日志配置，并设置日志输出格式和级别"""
+    global _logger_initialized
+    # 各模块导入时都会调用，已初始化则直接返回，无需再检查和加载配置
+    if _logger_initialized:
+        return logger
+
     if config is None:
         check_config_file()
-        # 先查缓存，避免在 async 上下文中重复 await load_config
-        config = cache_manager.get(CacheType.CONFIG, "main_config")
-        if config is None:
-            # 缓存也没有（理论上不该发生），才走 asyncio.run
-            config = asyncio.run(load_config())
+        # 优先命中缓存，缓存缺失时才同步加载
+        config = load_config_sync()
     log_config = config["log"]
-    global _logger_initialized
 
     # 第一次初始化时配置日志
     if not _logger_initialized:
@@ -115,6 +121,7 @@ def setup_logging(config=None):
     return logger
 
 
+@functools.lru_cache(maxsize=64)
 def create_connection_logger(selected_module_str):
-    """为连接创建独立的日志器，绑定特定的模块字符串"""
+    """为连接创建独立的日志器，绑定特定的模块字符串（相同模块字符串共享同一日志器）"""
     return logger.bind(selected_module=selected_module_str)
@@ -1,6 +1,10 @@
 import os
-import asyncio
-from config.config_loader import read_config, get_project_dir, load_config
+from config.config_loader import (
+    read_config,
+    get_project_dir,
+    load_config,
+    load_config_sync,
+)
 
 
 default_config_file = "config.yaml"
@@ -21,7 +25,7 @@ def check_config_file():
         )
 
     # 检查是否从API读取配置
-    config = asyncio.run(load_config())
+    config = load_config_sync()
     if config.get("read_config_from_api", False):
         print("从API读取配置")
         old_config_origin = read_config(custom_config_file)
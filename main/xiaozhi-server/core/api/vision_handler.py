@@ -1,5 +1,5 @@
+import asyncio
 import json
-import copy
 from aiohttp import web
 from config.logger import setup_logging
 from core.api.base_handler import BaseHandler
@@ -101,7 +101,8 @@ class VisionHandler(BaseHandler):
             image_base64 = base64.b64encode(image_data).decode("utf-8")
 
             # 如果开启了智控台，则从智控台获取模型配置
-            current_config = copy.deepcopy(self.config)
+            # 此处只读取配置，无需深拷贝全局配置
+            current_config = self.config
             read_config_from_api = current_config.get("read_config_from_api", False)
             if read_config_from_api:
                 current_config = await get_private_config_from_api(
@@ -127,7 +128,8 @@ class VisionHandler(BaseHandler):
                 vllm_type, current_config["VLLM"][select_vllm_module]
             )
 
-            result = vllm.response(question, image_base64)
+            # 视觉模型为同步阻塞调用，放到线程池中执行，避免阻塞同一事件循环上的WebSocket连接
+            result = await asyncio.to_thread(vllm.response, question, image_base64)
 
             return_json = {
                 "success": True,
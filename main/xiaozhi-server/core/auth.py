@@ -2,6 +2,7 @@ import hmac
 import base64
 import hashlib
 import time
+from collections import OrderedDict
 
 
 class AuthenticationError(Exception):
@@ -19,19 +20,31 @@ class AuthManager:
     在 Websocket 中，header:{Device-ID: device_id, Client-ID: client_id, Authorization: Bearer token, ......}
     """
 
+    # 已验证通过的签名缓存容量
+    VERIFIED_CACHE_SIZE = 1024
+
     def __init__(self, secret_key: str, expire_seconds: int = 60 * 60 * 24 * 30):
         if not expire_seconds or expire_seconds < 0:
             self.expire_seconds = 60 * 60 * 24 * 30
         else:
             self.expire_seconds = expire_seconds
         self.secret_key = secret_key
+        # 预先完成密钥填充，签名时复制该对象即可，省去每次派生ipad/opad的开销
+        self._hmac_template = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+        # 设备重连时通常携带同一个token，缓存验证通过的(签名, 时间戳, client_id, username)，
+        # 命中时跳过HMAC计算；只缓存成功结果，避免无效token占满缓存
+        self._verified_cache = OrderedDict()
+
+    def _sign_bytes(self, content: str) -> bytes:
+        """HMAC-SHA256签名并Base64编码，返回去掉填充的bytes"""
+        h = self._hmac_template.copy()
+        h.update(content.encode("utf-8"))
+        # 32字节摘要编码后固定为44个字符，末尾恰好1个'='
+        return base64.urlsafe_b64encode(h.digest())[:-1]
 
     def _sign(self, content: str) -> str:
         """HMAC-SHA256签名并Base64编码"""
-        sig = hmac.new(
-            self.secret_key.encode("utf-8"), content.encode("utf-8"), hashlib.sha256
-        ).digest()
-        return base64.urlsafe_b64encode(sig).decode("utf-8").rstrip("=")
+        return self._sign_bytes(content).decode("ascii")
 
     def generate_token(self, client_id: str, username: str) -> str:
         """
@@ -63,10 +76,18 @@ class AuthManager:
             if int(time.time()) - ts > self.expire_seconds:
                 return False  # 过期
 
-            expected_sig = self._sign(f"{client_id}|{username}|{ts}")
-            if not hmac.compare_digest(sig_part, expected_sig):
+            cache_key = (sig_part, ts, client_id, username)
+            if cache_key in self._verified_cache:
+                self._verified_cache.move_to_end(cache_key)
+                return True
+
+            expected_sig = self._sign_bytes(f"{client_id}|{username}|{ts}")
+            if not hmac.compare_digest(sig_part.encode("ascii"), expected_sig):
                 return False
 
+            self._verified_cache[cache_key] = True
+            if len(self._verified_cache) > self.VERIFIED_CACHE_SIZE:
+                self._verified_cache.popitem(last=False)
             return True
         except Exception:
             return False
@@ -19,6 +19,7 @@ from core.utils.util import (
     check_vad_update,
     check_asr_update,
     filter_sensitive_info,
+    parse_bool,
 )
 from typing import Dict, Any
 from collections import deque
@@ -29,7 +30,7 @@ from core.utils.modules_initialize import (
 )
 from core.handle.reportHandle import report, enqueue_tool_report
 from core.providers.tts.default import DefaultTTS
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from core.utils.dialogue import Message, Dialogue
 from core.providers.asr.dto.dto import InterfaceType
 from core.handle.textHandle import handleTextMessage
@@ -45,9 +46,12 @@ from core.utils.prompt_manager import PromptManager
 from core.utils.voiceprint_provider import VoiceprintProvider
 from core.utils.util import get_system_error_response
 from core.utils import textUtils
+from core.utils import llm_response_cache
+from core.utils import llm as llm_utils
 
 
 TAG = __name__
+logger = setup_logging()
 
 auto_import_modules("plugins_func.functions")
 
@@ -55,6 +59,27 @@ auto_import_modules("plugins_func.functions")
 class TTSException(RuntimeError):
     pass
 
+
+# 聊天记录上报是短时的网络请求，所有连接共用一个线程池，
+# 不再占用各连接自身的线程池（连接线程池负责对话等长任务）
+REPORT_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="chat_report")
+
+# 上下文信息（位置、天气等）在组件初始化期间获取，使用独立线程池：
+# 初始化本身运行在连接线程池中，若再提交到同一线程池并等待，线程池被占满时会互相等待而卡死
+CONTEXT_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="context_info")
+# 等待上下文信息的最长时间（秒）
+CONTEXT_INFO_TIMEOUT = 10
+
+# 大模型流式输出的小片段先在本地合并，遇到断句标点或累计到一定长度再送入TTS队列，
+# 标点与TTS首句断句使用的集合一致，合并不会推迟TTS的分句时机
+_TTS_TEXT_FLUSH_PATTERN = re.compile(r"[，~、,。？?！!；;：\n]")
+_TTS_TEXT_BATCH_MAX_CHARS = 80
+# 流式送出 direct_answer 文本时保留的尾部字符数，防止 JSON 闭合符号泄漏到 TTS
+_DA_STREAM_BUFFER = 5
+
+# 差异化配置可能重新创建的组件，名称与 initialize_modules 返回的键及连接上的属性名一致
+PRIVATE_MODULE_NAMES = ("tts", "vad", "asr", "llm", "intent", "memory")
+
 # direct_answer 虚拟工具定义
 # 不是真实工具，是路由机制：将"调不调工具"的二选一变为"调哪个"的多选，防止小模型误触发真实工具
 DIRECT_ANSWER_TOOL = {
@@ -76,6 +101,35 @@ DIRECT_ANSWER_TOOL = {
 }
 
 
+# 连接生命周期内会被原地修改的配置段，创建连接时需要深拷贝，其余配置段与全局配置共享
+_CONNECTION_MUTABLE_CONFIG_SECTIONS = ("selected_module", "xiaozhi")
+
+
+def _copy_connection_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """为连接复制配置：顶层浅拷贝，仅深拷贝会被原地修改的配置段"""
+    conn_config = dict(config)
+    for section in _CONNECTION_MUTABLE_CONFIG_SECTIONS:
+        if section in conn_config:
+            conn_config[section] = copy.deepcopy(conn_config[section])
+    return conn_config
+
+
+def _clear_queue(q) -> None:
+    """清空队列：queue.Queue 持锁一次性清空底层 deque，其他队列以非阻塞方式逐个取出"""
+    if isinstance(q, queue.Queue):
+        with q.mutex:
+            q.queue.clear()
+            q.unfinished_tasks = 0
+            q.all_tasks_done.notify_all()
+            q.not_full.notify_all()
+        return
+    while True:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            break
+
+
 class ConnectionHandler:
     def __init__(
             self,
@@ -88,9 +142,9 @@ class ConnectionHandler:
             server=None,
     ):
         self.common_config = config
-        self.config = copy.deepcopy(config)
-        self.session_id = str(uuid.uuid4())
-        self.logger = setup_logging()
+        self.config = _copy_connection_config(config)
+        self.session_id = uuid.uuid4().hex
+        self.logger = logger
         self.server = server  # 保存server实例的引用
 
         self.need_bind = False  # 是否需要绑定设备
@@ -104,6 +158,7 @@ class ConnectionHandler:
         self.websocket: websockets.ServerConnection | None = None
         self.headers = None
         self.device_id = None
+        self.client_id = None
         self.client_ip = None
         self.prompt = None
         self.welcome_msg = None
@@ -124,7 +179,8 @@ class ConnectionHandler:
         self.executor = ThreadPoolExecutor(max_workers=5)
 
         # 添加上报线程池
-        self.report_queue = queue.Queue()
+        # 单生产者单消费者且无需 join，使用更轻量的 SimpleQueue
+        self.report_queue = queue.SimpleQueue()
         self.report_thread = None
         # 未来可以通过修改此处，调节asr的上报和tts的上报，目前默认都开启
         self.report_asr_enable = self.read_config_from_api
@@ -139,6 +195,10 @@ class ConnectionHandler:
         self.llm = _llm
         self.memory = _memory
         self.intent = _intent
+        # 记忆总结/意图识别使用的专用LLM，按LLM名称缓存
+        self._dedicated_llms = {}
+        # 本连接从共享池获取的LLM实例，关闭连接时释放引用
+        self._acquired_llms = []
 
         # 为每个连接单独管理声纹识别
         self.voiceprint_provider = None
@@ -147,17 +207,21 @@ class ConnectionHandler:
         self.client_audio_buffer = bytearray()
         self.client_have_voice = False
         self.client_voice_window = deque(maxlen=5)
-        self.first_activity_time = 0.0  # 记录首次活动的时间（毫秒）
-        self.last_activity_time = 0.0  # 统一的活动时间戳（毫秒）
-        self.vad_last_voice_time = 0.0  # 记录用户最后一次说话的时间（毫秒）
+        self.client_voice_count = 0  # 滑动窗口中判定为有声的帧数，随窗口增量维护
+        self.first_activity_time = 0.0  # 记录首次活动的时间（单调时钟，秒）
+        self.last_activity_time = 0.0  # 统一的活动时间戳（单调时钟，秒）
+        self.vad_last_voice_time = 0.0  # 记录用户最后一次说话的时间（单调时钟，秒）
         self.client_voice_stop = False
         self.last_is_voice = False
+        # 唤醒后短暂忽略VAD，在此给出默认值，避免每帧音频都用hasattr探测
+        self.just_woken_up = False
+        self.vad_resume_task = None
 
         # asr相关变量
         # 因为实际部署时可能会用到公共的本地ASR，不能把变量暴露给公共ASR
         # 所以涉及到ASR的变量，需要在这里定义，属于connection的私有变量
         self.asr_audio = []  # 存储PCM帧列表，供VAD和ASR共享
-        self.asr_audio_queue = queue.Queue()
+        self.asr_audio_queue = queue.SimpleQueue()  # 每帧音频入队，使用无任务计数的 SimpleQueue
         self.current_speaker = None  # 存储当前说话人
         self.introduced_speakers = set()  # 已"首次引入"的说话人，控制只在首轮带名字
         self.system_introduced_speakers = set()  # 已在 system 注入过身份的说话人，控制 system 身份只首轮出现
@@ -167,6 +231,9 @@ class ConnectionHandler:
 
         # tts相关变量
         self.sentence_id = None
+        # 音频流控器与流控状态，首次发送音频时创建
+        self.audio_rate_controller = None
+        self.audio_flow_control = {}
         # 处理TTS响应没有文本返回
         self.tts_MessageText = ""
 
@@ -174,17 +241,28 @@ class ConnectionHandler:
         self.iot_descriptors = {}
         self.func_handler = None
 
-        self.cmd_exit = self.config["exit_commands"]
+        # 退出命令与唤醒词每轮对话都要匹配，转为集合后按哈希查找
+        self.cmd_exit = frozenset(self.config["exit_commands"])
+        self.wakeup_words = frozenset(self.config.get("wakeup_words") or ())
 
         # 是否在聊天结束后关闭连接
         self.close_after_chat = False
         self.load_function_plugin = False
         self.intent_type = "nointent"
 
+        # 无语音关闭时长（秒），每帧音频都会用到，创建连接时解析一次
+        self.close_no_voice_seconds = int(
+            self.config.get("close_connection_no_voice_time", 120)
+        )
         self.timeout_seconds = (
-                int(self.config.get("close_connection_no_voice_time", 120)) + 60
+                self.close_no_voice_seconds + 60
         )  # 在原来第一道关闭的基础上加60秒，进行二道关闭
         self.timeout_task = None
+        self.llm_response_cache_enabled = parse_bool(
+            self.config.get("enable_llm_response_cache", False)
+        )
+        # 持有后台任务的强引用，防止事件循环只保留弱引用导致任务中途被回收
+        self._background_tasks = set()
 
         # {"mcp":true} 表示启用MCP功能
         self.features = None
@@ -192,14 +270,28 @@ class ConnectionHandler:
         # 标记连接是否来自MQTT
         self.conn_from_mqtt_gateway = False
 
-        # 初始化提示词管理器
-        self.prompt_manager = PromptManager(self.config, self.logger)
+        # 提示词管理器延迟到组件初始化线程中首次使用时再创建，避免阻塞连接建立
+        self._prompt_manager = None
 
         # 初始化通话状态
         self.calling = False
         # 标记当前是否为来电接听模式
         self.incoming_call = None
 
+    @property
+    def prompt_manager(self):
+        """首次访问时创建提示词管理器（读取模板文件，应在线程池中触发）"""
+        if self._prompt_manager is None:
+            self._prompt_manager = PromptManager(self.config, self.logger)
+        return self._prompt_manager
+
+    def _spawn_background_task(self, coro):
+        """创建后台任务并保存引用，任务结束后自动移除"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     async def handle_connection(self, ws: websockets.ServerConnection):
         try:
             # 获取运行中的事件循环（必须在异步上下文中）
@@ -208,17 +300,16 @@ class ConnectionHandler:
             # 获取并验证headers
             self.headers = dict(ws.request.headers)
             real_ip = self.headers.get("x-real-ip") or self.headers.get(
-                "x-forwarded-for"
+                "x-forwarded-for", ""
             )
-            if real_ip:
-                self.client_ip = real_ip.split(",")[0].strip()
-            else:
-                self.client_ip = ws.remote_address[0]
+            # 只取代理链中的第一个地址，partition不会为其余地址构造列表
+            self.client_ip = real_ip.partition(",")[0].strip() or ws.remote_address[0]
             self.logger.bind(tag=TAG).info(
                 f"{self.client_ip} conn - Headers: {self.headers}"
             )
 
             self.device_id = self.headers.get("device-id", None)
+            self.client_id = self.headers.get("client-id", self.device_id)
 
             # 认证通过,继续处理
             self.websocket = ws
@@ -230,8 +321,8 @@ class ConnectionHandler:
                 self.logger.bind(tag=TAG).info("连接来自:MQTT网关")
 
             # 初始化活动时间戳
-            self.first_activity_time = time.time() * 1000
-            self.last_activity_time = time.time() * 1000
+            self.update_activity_time()
+            self.first_activity_time = self.last_activity_time
 
             # 启动超时检查任务
             self.timeout_task = asyncio.create_task(self._check_timeout())
@@ -247,7 +338,7 @@ class ConnectionHandler:
             self.logger.bind(tag=TAG).info(f"配置输出音频采样率为: {self.sample_rate}")
 
             # 在后台初始化配置和组件（完全不阻塞主循环）
-            asyncio.create_task(self._background_initialize())
+            self._spawn_background_task(self._background_initialize())
 
             try:
                 async for message in self.websocket:
@@ -282,18 +373,10 @@ class ConnectionHandler:
             if self.session_id:
                 def generate_title_task():
                     try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        loop.run_until_complete(
-                            generate_and_save_chat_title(self.session_id)
-                        )
+                        # asyncio.run 负责创建并关闭线程内的事件循环
+                        asyncio.run(generate_and_save_chat_title(self.session_id))
                     except Exception as e:
                         self.logger.bind(tag=TAG).error(f"生成标题失败: {e}")
-                    finally:
-                        try:
-                            loop.close()
-                        except Exception:
-                            pass
 
                 threading.Thread(target=generate_title_task, daemon=True).start()
 
@@ -302,21 +385,14 @@ class ConnectionHandler:
                 # 使用线程池异步保存记忆
                 def save_memory_task():
                     try:
-                        # 创建新事件循环（避免与主循环冲突）
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        loop.run_until_complete(
+                        # 在线程内独立的事件循环中运行（避免与主循环冲突）
+                        asyncio.run(
                             self.memory.save_memory(
                                 self.dialogue.dialogue, self.session_id
                             )
                         )
                     except Exception as e:
                         self.logger.bind(tag=TAG).error(f"保存记忆失败: {e}")
-                    finally:
-                        try:
-                            loop.close()
-                        except Exception:
-                            pass
 
                 # 启动线程保存记忆，不等待完成
                 threading.Thread(target=save_memory_task, daemon=True).start()
@@ -340,7 +416,7 @@ class ConnectionHandler:
             # 复用现有的绑定提示逻辑
             from core.handle.receiveAudioHandle import check_bind_device
 
-            asyncio.create_task(check_bind_device(self))
+            self._spawn_background_task(check_bind_device(self))
 
     async def _route_message(self, message):
         """消息路由"""
@@ -544,7 +620,7 @@ class ConnectionHandler:
             pcm_frame = self._connection_opus_decoder.decode(opus_packet, 960)
             return pcm_frame
         except Exception as e:
-            self.logger.bind(tag=TAG).debug(f"Opus解码失败: {e}")
+            self.logger.bind(tag=TAG).debug("Opus解码失败: {}", e)
             return None
 
     def _init_connection_state(self, conn):
@@ -616,6 +692,12 @@ class ConnectionHandler:
             )
             self.logger = create_connection_logger(self.selected_module_str)
 
+            # 上下文信息（位置、天气、动态上下文）依赖网络请求且与其余组件互不依赖，
+            # 提前提交到线程池，与ASR、记忆、意图等组件的初始化并行执行
+            context_future = CONTEXT_EXECUTOR.submit(
+                self.prompt_manager.update_context_info, self, self.client_ip
+            )
+
             """初始化组件"""
             if self.config.get("prompt") is not None:
                 user_prompt = self.config["prompt"]
@@ -646,17 +728,29 @@ class ConnectionHandler:
             """初始化上报线程"""
             self._init_report_threads()
             """更新系统提示词"""
-            self._init_prompt_enhancement()
+            self._init_prompt_enhancement(context_future)
             """注入工具调用few-shot示例（仅function_call模式）"""
             self._inject_tool_call_fewshot()
 
         except Exception as e:
             self.logger.bind(tag=TAG).error(f"实例化组件失败: {e}")
 
-    def _init_prompt_enhancement(self):
+    def _init_prompt_enhancement(self, context_future=None):
 
-        # 更新上下文信息
-        self.prompt_manager.update_context_info(self, self.client_ip)
+        # 更新上下文信息（已提前提交时等待其完成即可）
+        if context_future is not None:
+            try:
+                context_future.result(timeout=CONTEXT_INFO_TIMEOUT)
+            except FutureTimeoutError:
+                if context_future.cancel():
+                    # 任务尚未开始执行，改为在当前线程同步获取
+                    context_future = None
+                else:
+                    self.logger.bind(tag=TAG).warning(
+                        f"获取上下文信息超过 {CONTEXT_INFO_TIMEOUT} 秒，使用已有信息构建提示词"
+                    )
+        if context_future is None:
+            self.prompt_manager.update_context_info(self, self.client_ip)
         enhanced_prompt = self.prompt_manager.build_enhanced_prompt(
             self.config["prompt"],
             self.device_id,
@@ -780,7 +874,7 @@ class ConnectionHandler:
                 else:
                     self.logger.bind(tag=TAG).warning("声纹识别功能启用但配置不完整")
             else:
-                self.logger.bind(tag=TAG).info("声纹识别功能未启用")
+                self.logger.bind(tag=TAG).debug("声纹识别功能未启用")
         except Exception as e:
             self.logger.bind(tag=TAG).warning(f"声纹识别初始化失败: {str(e)}")
 
@@ -804,8 +898,8 @@ class ConnectionHandler:
             begin_time = time.time()
             private_config = await get_private_config_from_api(
                 self.config,
-                self.headers.get("device-id"),
-                self.headers.get("client-id", self.headers.get("device-id")),
+                self.device_id,
+                self.client_id,
             )
             private_config["delete_audio"] = bool(self.config.get("delete_audio", True))
             self.logger.bind(tag=TAG).info(
@@ -901,9 +995,13 @@ class ConnectionHandler:
         # 注入替换词到 TTS 模块配置
         if private_config.get("correct_words", None) is not None:
             select_tts_module = self.config["selected_module"]["TTS"]
-            self.config["TTS"][select_tts_module]["correct_words"] = private_config[
-                "correct_words"
-            ]
+            # TTS配置段可能与全局配置共享，写入前先复制，避免影响其他连接
+            tts_module_config = dict(self.config["TTS"][select_tts_module])
+            tts_module_config["correct_words"] = private_config["correct_words"]
+            self.config["TTS"] = {
+                **self.config["TTS"],
+                select_tts_module: tts_module_config,
+            }
 
         # 使用 run_in_executor 在线程池中执行 initialize_modules，避免阻塞主循环
         try:
@@ -922,18 +1020,36 @@ class ConnectionHandler:
         except Exception as e:
             self.logger.bind(tag=TAG).error(f"初始化组件失败: {e}")
             modules = {}
-        if modules.get("tts", None) is not None:
-            self.tts = modules["tts"]
-        if modules.get("vad", None) is not None:
-            self.vad = modules["vad"]
-        if modules.get("asr", None) is not None:
-            self.asr = modules["asr"]
-        if modules.get("llm", None) is not None:
-            self.llm = modules["llm"]
-        if modules.get("intent", None) is not None:
-            self.intent = modules["intent"]
-        if modules.get("memory", None) is not None:
-            self.memory = modules["memory"]
+        for name in PRIVATE_MODULE_NAMES:
+            instance = modules.get(name)
+            if instance is not None:
+                setattr(self, name, instance)
+        if modules.get("llm") is not None:
+            self._acquired_llms.append(modules["llm"])
+
+    def _get_dedicated_llm(self, llm_name, purpose):
+        """获取记忆总结/意图识别使用的专用LLM，未配置时返回None
+
+        与主LLM同名时直接复用主LLM；同名的专用LLM在一个连接内只创建一次，
+        记忆与意图配置同一个LLM时共享该实例
+        """
+        if not llm_name:
+            return None
+        llm_config = self.config["LLM"].get(llm_name)
+        if llm_config is None:
+            return None
+        if llm_name == self.config["selected_module"].get("LLM") and self.llm:
+            return self.llm
+        llm_instance = self._dedicated_llms.get(llm_name)
+        if llm_instance is None:
+            llm_type = llm_config.get("type", llm_name)
+            llm_instance = llm_utils.create_shared_instance(llm_type, llm_config)
+            self._dedicated_llms[llm_name] = llm_instance
+            self._acquired_llms.append(llm_instance)
+            self.logger.bind(tag=TAG).info(
+                f"为{purpose}创建了专用LLM: {llm_name}, 类型: {llm_type}"
+            )
+        return llm_instance
 
     def _initialize_memory(self):
         if self.memory is None:
@@ -946,31 +1062,16 @@ class ConnectionHandler:
             save_to_file=not self.read_config_from_api,
         )
 
-        # 获取记忆总结配置
-        memory_config = self.config["Memory"]
-        memory_type = self.config["Memory"][self.config["selected_module"]["Memory"]][
-            "type"
-        ]
+        # 获取记忆总结配置（选中模块的配置只查一次）
+        memory_config = self.config["Memory"][self.config["selected_module"]["Memory"]]
+        memory_type = memory_config["type"]
         # 如果使用 nomen 或 mem_report_only，直接返回
         if memory_type == "nomem" or memory_type == "mem_report_only":
             return
         # 使用 mem_local_short 模式
         elif memory_type == "mem_local_short":
-            memory_llm_name = memory_config[self.config["selected_module"]["Memory"]][
-                "llm"
-            ]
-            if memory_llm_name and memory_llm_name in self.config["LLM"]:
-                # 如果配置了专用LLM，则创建独立的LLM实例
-                from core.utils import llm as llm_utils
-
-                memory_llm_config = self.config["LLM"][memory_llm_name]
-                memory_llm_type = memory_llm_config.get("type", memory_llm_name)
-                memory_llm = llm_utils.create_instance(
-                    memory_llm_type, memory_llm_config
-                )
-                self.logger.bind(tag=TAG).info(
-                    f"为记忆总结创建了专用LLM: {memory_llm_name}, 类型: {memory_llm_type}"
-                )
+            memory_llm = self._get_dedicated_llm(memory_config["llm"], "记忆总结")
+            if memory_llm is not None:
                 self.memory.set_llm(memory_llm)
             else:
                 # 否则使用主LLM
@@ -980,39 +1081,21 @@ class ConnectionHandler:
     def _initialize_intent(self):
         if self.intent is None:
             return
-        self.intent_type = self.config["Intent"][
-            self.config["selected_module"]["Intent"]
-        ]["type"]
-        if self.intent_type == "function_call" or self.intent_type == "intent_llm":
-            self.load_function_plugin = True
         """初始化意图识别模块"""
-        # 获取意图识别配置
-        intent_config = self.config["Intent"]
-        intent_type = self.config["Intent"][self.config["selected_module"]["Intent"]][
-            "type"
-        ]
+        # 获取意图识别配置（选中模块的配置只查一次）
+        intent_config = self.config["Intent"][self.config["selected_module"]["Intent"]]
+        # 意图类型只有少数几种取值，驻留后各连接共享同一字符串对象
+        intent_type = self.intent_type = sys.intern(intent_config["type"])
+        if intent_type == "function_call" or intent_type == "intent_llm":
+            self.load_function_plugin = True
 
         # 如果使用 nointent，直接返回
         if intent_type == "nointent":
             return
         # 使用 intent_llm 模式
         elif intent_type == "intent_llm":
-            intent_llm_name = intent_config[self.config["selected_module"]["Intent"]][
-                "llm"
-            ]
-
-            if intent_llm_name and intent_llm_name in self.config["LLM"]:
-                # 如果配置了专用LLM，则创建独立的LLM实例
-                from core.utils import llm as llm_utils
-
-                intent_llm_config = self.config["LLM"][intent_llm_name]
-                intent_llm_type = intent_llm_config.get("type", intent_llm_name)
-                intent_llm = llm_utils.create_instance(
-                    intent_llm_type, intent_llm_config
-                )
-                self.logger.bind(tag=TAG).info(
-                    f"为意图识别创建了专用LLM: {intent_llm_name}, 类型: {intent_llm_type}"
-                )
+            intent_llm = self._get_dedicated_llm(intent_config["llm"], "意图识别")
+            if intent_llm is not None:
                 self.intent.set_llm(intent_llm)
             else:
                 # 否则使用主LLM
@@ -1054,6 +1137,9 @@ class ConnectionHandler:
             # 递归调用时，使用当前的sentence_id
             current_sentence_id = self.sentence_id
 
+        # 回复缓存键，在查询记忆之后生成
+        response_cache_key = None
+
         # 设置最大递归深度，避免无限循环，可根据实际需求调整
         MAX_DEPTH = 5
         force_final_answer = False  # 标记是否强制最终回答
@@ -1084,6 +1170,8 @@ class ConnectionHandler:
             # 递归调用（depth>0）不注入，避免模型在生成文本回复时再次调 direct_answer 导致循环
             if functions is not None and depth == 0:
                 functions.append(DIRECT_ANSWER_TOOL)
+        # 本轮的响应格式在请求前就已确定，流式循环中不再逐块判断
+        use_functions = self.intent_type == "function_call" and functions is not None
 
         response_message = []
 
@@ -1097,6 +1185,25 @@ class ConnectionHandler:
                 )
                 memory_str = future.result()
 
+            # 回复缓存只用于不带工具的顶层对话，function_call 模式的回复可能触发工具调用
+            if (
+                    depth == 0
+                    and self.llm_response_cache_enabled
+                    and self.intent_type != "function_call"
+            ):
+                response_cache_key = llm_response_cache.build_cache_key(
+                    self.device_id,
+                    self._get_llm_cache_name(),
+                    self.dialogue,
+                    query,
+                    memory_str,
+                )
+                if response_cache_key is not None:
+                    cached_response = llm_response_cache.get_response(response_cache_key)
+                    if cached_response is not None:
+                        self._reply_with_cached_response(current_sentence_id, cached_response)
+                        return True
+
             # 仅在该说话人首次出现时把身份注入 system，之后靠对话历史首轮保留，
             # 避免每轮在 system 重复出现名字诱导模型反复称呼
             speaker_for_system = None
@@ -1105,7 +1212,7 @@ class ConnectionHandler:
                 self.system_introduced_speakers.add(cs)
                 speaker_for_system = cs
 
-            if self.intent_type == "function_call" and functions is not None:
+            if use_functions:
                 # 使用支持functions的streaming接口
                 llm_responses = self.llm.response_with_functions(
                     self.session_id,
@@ -1131,11 +1238,14 @@ class ConnectionHandler:
         tool_calls_list = []  # 格式: [{"id": "", "name": "", "arguments": ""}]
         content_arguments = ""
         emotion_flag = True
+        # 尚未送入TTS队列的文本片段
+        pending_tts_text = []
+        pending_tts_chars = 0
         try:
             for response in llm_responses:
                 if self.client_abort:
                     break
-                if self.intent_type == "function_call" and functions is not None:
+                if use_functions:
                     content, tools_call = response
                     if "content" in response:
                         content = response["content"]
@@ -1153,7 +1263,6 @@ class ConnectionHandler:
 
                     # 流式提取 direct_answer 的 response 参数，实时送 TTS
                     # 使用安全缓冲区，防止 JSON 闭合符号泄漏到 TTS
-                    _DA_STREAM_BUFFER = 5
                     for tc in tool_calls_list:
                         if tc["name"] == "direct_answer" and tc.get("arguments"):
                             da_text = self._extract_direct_answer_response(tc["arguments"])
@@ -1166,6 +1275,11 @@ class ConnectionHandler:
                                     new_part = self._clean_response_garbage(new_part)
                                     if new_part:
                                         tc["_da_sent"] = safe_end
+                                        # 先送出此前缓冲的普通文本，保证播报顺序与模型输出一致
+                                        if pending_tts_text:
+                                            self._put_tts_text(current_sentence_id, pending_tts_text)
+                                            pending_tts_text = []
+                                            pending_tts_chars = 0
                                         self.tts.tts_text_queue.put(
                                             TTSMessageDTO(
                                                 sentence_id=current_sentence_id,
@@ -1189,16 +1303,19 @@ class ConnectionHandler:
                 if content is not None and len(content) > 0:
                     if not tool_call_flag:
                         response_message.append(content)
-                        self.tts.tts_text_queue.put(
-                            TTSMessageDTO(
-                                sentence_id=current_sentence_id,
-                                sentence_type=SentenceType.MIDDLE,
-                                content_type=ContentType.TEXT,
-                                content_detail=content,
-                            )
-                        )
+                        pending_tts_text.append(content)
+                        pending_tts_chars += len(content)
+                        if (
+                                pending_tts_chars >= _TTS_TEXT_BATCH_MAX_CHARS
+                                or _TTS_TEXT_FLUSH_PATTERN.search(content)
+                        ):
+                            self._put_tts_text(current_sentence_id, pending_tts_text)
+                            pending_tts_text = []
+                            pending_tts_chars = 0
+            self._put_tts_text(current_sentence_id, pending_tts_text)
         except Exception as e:
             self.logger.bind(tag=TAG).error(f"LLM stream processing error: {e}")
+            self._put_tts_text(current_sentence_id, pending_tts_text)
             self.tts.tts_text_queue.put(
                 TTSMessageDTO(
                     sentence_id=current_sentence_id,
@@ -1307,7 +1424,10 @@ class ConnectionHandler:
                 futures_with_data = []
                 for tool_call_data in tool_calls_list:
                     self.logger.bind(tag=TAG).debug(
-                        f"function_name={tool_call_data['name']}, function_id={tool_call_data['id']}, function_arguments={tool_call_data['arguments']}"
+                        "function_name={}, function_id={}, function_arguments={}",
+                        tool_call_data["name"],
+                        tool_call_data["id"],
+                        tool_call_data["arguments"],
                     )
 
                     # 使用公共方法上报工具调用
@@ -1355,6 +1475,13 @@ class ConnectionHandler:
             text_buff = "".join(response_message)
             self.tts.store_tts_text(current_sentence_id, text_buff)
             self.dialogue.put(Message(role="assistant", content=text_buff))
+            # 只缓存未被打断、未调用工具的完整回复
+            if (
+                    response_cache_key is not None
+                    and not tool_call_flag
+                    and not self.client_abort
+            ):
+                llm_response_cache.set_response(response_cache_key, text_buff)
 
         if depth == 0:
             self.tts.tts_text_queue.put(
@@ -1365,10 +1492,11 @@ class ConnectionHandler:
                 )
             )
             # 使用lambda延迟计算，只有在DEBUG级别时才执行get_llm_dialogue()
-            self.logger.bind(tag=TAG).debug(
+            self.logger.bind(tag=TAG).opt(lazy=True).debug(
+                "{}",
                 lambda: json.dumps(
                     self.dialogue.get_llm_dialogue(), indent=4, ensure_ascii=False
-                )
+                ),
             )
 
         return True
@@ -1386,7 +1514,8 @@ class ConnectionHandler:
                 text = result.response if result.response else result.result
                 if streamed_text and text in streamed_text:
                     self.logger.bind(tag=TAG).debug(
-                        f"Skipping duplicate TTS for tool {tool_call_data['name']}, already streamed"
+                        "Skipping duplicate TTS for tool {}, already streamed",
+                        tool_call_data["name"],
                     )
                 else:
                     self.tts.tts_one_sentence(self, ContentType.TEXT, content_detail=text)
@@ -1490,11 +1619,11 @@ class ConnectionHandler:
                 if item is None:  # 检测毒丸对象
                     break
                 try:
-                    # 检查线程池状态
+                    # 连接已关闭则不再提交
                     if self.executor is None:
                         continue
-                    # 提交任务到线程池
-                    self.executor.submit(self._process_report, *item)
+                    # 提交任务到共享的上报线程池
+                    REPORT_EXECUTOR.submit(self._process_report, *item)
                 except Exception as e:
                     self.logger.bind(tag=TAG).error(f"聊天记录上报线程异常: {e}")
             except queue.Empty:
@@ -1511,9 +1640,10 @@ class ConnectionHandler:
             asyncio.run(report(self, type, text, audio_data, report_time))
         except Exception as e:
             self.logger.bind(tag=TAG).error(f"上报处理异常: {e}")
-        finally:
-            # 标记任务完成
-            self.report_queue.task_done()
+
+    def update_activity_time(self):
+        """刷新活动时间戳（单调时钟，不受系统时间调整影响）"""
+        self.last_activity_time = time.monotonic()
 
     def clearSpeakStatus(self):
         self.client_is_speaking = False
@@ -1531,11 +1661,10 @@ class ConnectionHandler:
                 self.vad.release_conn_resources(self)
 
             # 清理opus解码器
-            if hasattr(self, "_connection_opus_decoder"):
-                try:
-                    delattr(self, "_connection_opus_decoder")
-                except Exception:
-                    pass
+            try:
+                delattr(self, "_connection_opus_decoder")
+            except AttributeError:
+                pass
 
             # 清理音频缓冲区
             if hasattr(self, "audio_buffer"):
@@ -1550,6 +1679,13 @@ class ConnectionHandler:
                     pass
                 self.timeout_task = None
 
+            # 取消尚未结束的后台任务（不包括当前正在执行close的任务）
+            if self._background_tasks:
+                current_task = asyncio.current_task()
+                for task in list(self._background_tasks):
+                    if task is not current_task and not task.done():
+                        task.cancel()
+
             # 取消AEC缓存清理任务
             if hasattr(self, "_aec_cache_cleanup_task") and self._aec_cache_cleanup_task and not self._aec_cache_cleanup_task.done():
                 self._aec_cache_cleanup_task.cancel()
@@ -1573,6 +1709,9 @@ class ConnectionHandler:
                         f"清理工具处理器时出错: {cleanup_error}"
                     )
 
+            # 清理LLM中本会话的状态，并释放从共享池获取的实例
+            self._release_llms()
+
             # 触发停止事件
             if self.stop_event:
                 self.stop_event.set()
@@ -1616,10 +1755,15 @@ class ConnectionHandler:
             except Exception as ws_error:
                 self.logger.bind(tag=TAG).error(f"关闭WebSocket连接时出错: {ws_error}")
 
-            if self.tts:
-                await self.tts.close()
-            if self.asr:
-                await self.asr.close()
+            # TTS与ASR的关闭互不依赖，并发执行以缩短断开耗时
+            close_coros = [
+                provider.close() for provider in (self.tts, self.asr) if provider
+            ]
+            if close_coros:
+                results = await asyncio.gather(*close_coros, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        self.logger.bind(tag=TAG).error(f"关闭语音通道时出错: {result}")
 
             # 最后关闭线程池（避免阻塞）
             if self.executor:
@@ -1645,22 +1789,16 @@ class ConnectionHandler:
                 f"开始清理: TTS队列大小={self.tts.tts_text_queue.qsize()}, 音频队列大小={self.tts.tts_audio_queue.qsize()}"
             )
 
-            # 使用非阻塞方式清空队列
-            for q in [
+            for q in (
                 self.tts.tts_text_queue,
                 self.tts.tts_audio_queue,
                 self.report_queue,
-            ]:
-                if not q:
-                    continue
-                while True:
-                    try:
-                        q.get_nowait()
-                    except queue.Empty:
-                        break
+            ):
+                if q is not None:
+                    _clear_queue(q)
 
             # 重置音频流控器（取消后台任务并清空队列）
-            if hasattr(self, "audio_rate_controller") and self.audio_rate_controller:
+            if self.audio_rate_controller:
                 self.audio_rate_controller.reset()
                 self.logger.bind(tag=TAG).debug("已重置音频流控器")
 
@@ -1677,6 +1815,7 @@ class ConnectionHandler:
         self.client_have_voice = False
         self.client_voice_stop = False
         self.client_voice_window.clear()
+        self.client_voice_count = 0
         self.last_is_voice = False
         self.vad_last_voice_time = 0.0
 
@@ -1685,6 +1824,66 @@ class ConnectionHandler:
 
         self.logger.bind(tag=TAG).debug("All audio states reset.")
 
+    def _put_tts_text(self, sentence_id, text_parts):
+        """将合并后的文本片段作为一条消息送入TTS队列"""
+        if text_parts:
+            self.tts.tts_text_queue.put(
+                TTSMessageDTO(
+                    sentence_id=sentence_id,
+                    sentence_type=SentenceType.MIDDLE,
+                    content_type=ContentType.TEXT,
+                    content_detail="".join(text_parts),
+                )
+            )
+
+    def _release_llms(self):
+        """清理各LLM中本会话的状态，并释放本连接对共享LLM实例的引用"""
+        llm_instances = {
+            id(instance): instance
+            for instance in (self.llm, *self._dedicated_llms.values())
+            if instance is not None
+        }
+        for llm_instance in llm_instances.values():
+            try:
+                llm_instance.close_session(self.session_id)
+            except Exception as e:
+                self.logger.bind(tag=TAG).error(f"清理LLM会话状态失败: {e}")
+        for llm_instance in self._acquired_llms:
+            llm_utils.release_shared_instance(llm_instance)
+        self._acquired_llms.clear()
+
+    def _get_llm_cache_name(self):
+        """当前主LLM的标识（模块名与模型名），用于区分不同模型的回复缓存"""
+        llm_module = self.config["selected_module"].get("LLM", "")
+        model_name = getattr(self.llm, "model_name", None) or ""
+        return f"{llm_module}:{model_name}"
+
+    def _reply_with_cached_response(self, sentence_id, response):
+        """使用缓存的回复完成本轮对话，流程与大模型流式回复一致"""
+        self.logger.bind(tag=TAG).info(f"命中大模型回复缓存: {response}")
+        if (self.features or {}).get("emoji", True):
+            asyncio.run_coroutine_threadsafe(
+                textUtils.get_emotion(self, response),
+                self.loop,
+            )
+        self.tts.tts_text_queue.put(
+            TTSMessageDTO(
+                sentence_id=sentence_id,
+                sentence_type=SentenceType.MIDDLE,
+                content_type=ContentType.TEXT,
+                content_detail=response,
+            )
+        )
+        self.tts.store_tts_text(sentence_id, response)
+        self.dialogue.put(Message(role="assistant", content=response))
+        self.tts.tts_text_queue.put(
+            TTSMessageDTO(
+                sentence_id=sentence_id,
+                sentence_type=SentenceType.LAST,
+                content_type=ContentType.ACTION,
+            )
+        )
+
     def chat_and_close(self, text):
         """Chat with the user and then close the connection"""
         try:
@@ -1704,10 +1903,13 @@ class ConnectionHandler:
                 if self.need_bind:
                     last_activity_time = self.first_activity_time
 
-                # 检查是否超时（只有在时间戳已初始化的情况下）
+                # 默认按固定间隔检查；时间戳已初始化时直接睡到预计超时时刻
+                sleep_seconds = 10
                 if last_activity_time > 0.0:
-                    current_time = time.time() * 1000
-                    if current_time - last_activity_time > self.timeout_seconds * 1000:
+                    remaining = (
+                        last_activity_time + self.timeout_seconds - time.monotonic()
+                    )
+                    if remaining < 0:
                         if not self.stop_event.is_set():
                             self.logger.bind(tag=TAG).info("连接超时，准备关闭")
                             # 设置停止事件，防止重复处理
@@ -1720,8 +1922,9 @@ class ConnectionHandler:
                                     f"超时关闭连接时出错: {close_error}"
                                 )
                         break
-                # 每10秒检查一次，避免过于频繁
-                await asyncio.sleep(10)
+                    # 期间有新的活动会推迟超时时刻，醒来后重新计算即可
+                    sleep_seconds = max(remaining, 1)
+                await asyncio.sleep(sleep_seconds)
         except Exception as e:
             self.logger.bind(tag=TAG).error(f"超时检查任务出错: {e}")
         finally:
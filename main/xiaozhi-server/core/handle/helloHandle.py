@@ -1,3 +1,4 @@
+import sys
 import time
 import json
 import uuid
@@ -12,7 +13,7 @@ from core.utils.util import audio_to_data
 from core.providers.tts.dto.dto import SentenceType
 from core.utils.wakeup_word import WakeupWordsConfig
 from core.handle.sendAudioHandle import sendAudioMessage, send_tts_message
-from core.utils.util import remove_punctuation_and_length, opus_datas_to_wav_bytes
+from core.utils.util import opus_datas_to_wav_bytes
 from core.providers.tools.device_mcp import MCPClient, send_mcp_initialize_message
 
 TAG = __name__
@@ -45,7 +46,8 @@ async def handleHelloMessage(conn: "ConnectionHandler", msg_json):
     if audio_params:
         format = audio_params.get("format")
         conn.logger.bind(tag=TAG).debug(f"客户端音频格式: {format}")
-        conn.audio_format = format
+        # 音频格式取值固定，驻留后避免每个连接各持有一份副本
+        conn.audio_format = sys.intern(format) if isinstance(format, str) else format
         conn.welcome_msg["audio_params"] = audio_params
     features = msg_json.get("features")
     if features:
@@ -64,9 +66,10 @@ async def handleHelloMessage(conn: "ConnectionHandler", msg_json):
 
 
 async def checkWakeupWords(conn: "ConnectionHandler", text):
-    enable_wakeup_words_response_cache = conn.config[
-        "enable_wakeup_words_response_cache"
-    ]
+    """检查是否是唤醒词，text 为已去除标点的文本"""
+    # 未开启唤醒词加速时直接返回，无需等待TTS初始化
+    if not conn.config["enable_wakeup_words_response_cache"]:
+        return False
 
     # 等待tts初始化，最多等待3秒
     start_time = time.time()
@@ -77,11 +80,7 @@ async def checkWakeupWords(conn: "ConnectionHandler", text):
     else:
         return False
 
-    if not enable_wakeup_words_response_cache:
-        return False
-
-    _, filtered_text = remove_punctuation_and_length(text)
-    if filtered_text not in conn.config.get("wakeup_words"):
+    if text not in conn.wakeup_words:
         return False
 
     conn.just_woken_up = True
@@ -128,9 +127,20 @@ async def wakeupWordsResponse(conn: "ConnectionHandler"):
     if not conn.tts:
         return
 
-    try:
-        # 尝试获取锁，如果获取不到就返回
-        if not await _wakeup_response_lock.acquire():
+    # 已有其他连接在更新唤醒词回复时直接返回，不在锁上排队
+    if _wakeup_response_lock.locked():
+        return
+
+    async with _wakeup_response_lock:
+        # 获取当前音色
+        voice = getattr(conn.tts, "voice", None) or "default"
+
+        # 双重检查：获取锁之前其他连接可能刚完成更新
+        response = wakeup_words_config.get_wakeup_response(voice)
+        if (
+            response
+            and time.time() - response.get("time", 0) <= WAKEUP_CONFIG["refresh_time"]
+        ):
             return
 
         # 从预定义回复列表中随机选择一个回复
@@ -143,9 +153,6 @@ async def wakeupWordsResponse(conn: "ConnectionHandler"):
         if not tts_result:
             return
 
-        # 获取当前音色
-        voice = getattr(conn.tts, "voice", "default")
-
         # 使用链接的sample_rate
         wav_bytes = opus_datas_to_wav_bytes(tts_result, sample_rate=conn.sample_rate)
         file_path = wakeup_words_config.generate_file_path(voice)
@@ -153,7 +160,3 @@ async def wakeupWordsResponse(conn: "ConnectionHandler"):
             f.write(wav_bytes)
         # 更新配置
         wakeup_words_config.update_wakeup_response(voice, file_path, result)
-    finally:
-        # 确保在任何情况下都释放锁
-        if _wakeup_response_lock.locked():
-            _wakeup_response_lock.release()
@@ -20,7 +20,8 @@ TAG = __name__
 async def handle_user_intent(conn: "ConnectionHandler", text):
     # 预处理输入文本，处理可能的JSON格式
     try:
-        if text.strip().startswith("{") and text.strip().endswith("}"):
+        stripped_text = text.strip()
+        if stripped_text.startswith("{") and stripped_text.endswith("}"):
             parsed_data = json.loads(text)
             if isinstance(parsed_data, dict) and "content" in parsed_data:
                 text = parsed_data["content"]  # 提取content用于意图分析
@@ -28,7 +29,7 @@ async def handle_user_intent(conn: "ConnectionHandler", text):
     except (json.JSONDecodeError, TypeError):
         pass
 
-    # 检查是否有明确的退出命令
+    # 检查是否有明确的退出命令（去除标点只做一次，退出命令与唤醒词检查共用）
     _, filtered_text = remove_punctuation_and_length(text)
     if await check_direct_exit(conn, filtered_text):
         return True
@@ -51,15 +52,12 @@ async def handle_user_intent(conn: "ConnectionHandler", text):
 
 
 async def check_direct_exit(conn: "ConnectionHandler", text):
-    """检查是否有明确的退出命令"""
-    _, text = remove_punctuation_and_length(text)
-    cmd_exit = conn.cmd_exit
-    for cmd in cmd_exit:
-        if text == cmd:
-            conn.logger.bind(tag=TAG).info(f"识别到明确的退出命令: {text}")
-            await send_stt_message(conn, text)
-            await conn.close()
-            return True
+    """检查是否有明确的退出命令，text 为已去除标点的文本"""
+    if text in conn.cmd_exit:
+        conn.logger.bind(tag=TAG).info(f"识别到明确的退出命令: {text}")
+        await send_stt_message(conn, text)
+        await conn.close()
+        return True
     return False
 
 
@@ -92,7 +90,8 @@ async def process_intent_result(
         if "function_call" in intent_data:
             # 直接从意图识别获取了function_call
             conn.logger.bind(tag=TAG).debug(
-                f"检测到function_call格式的意图结果: {intent_data['function_call']['name']}"
+                "检测到function_call格式的意图结果: {}",
+                intent_data["function_call"]["name"],
             )
             function_name = intent_data["function_call"]["name"]
             if function_name == "continue_chat":
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from core.connection import ConnectionHandler
-from core.utils.util import audio_to_data
+from core.utils.util import static_audio_to_data
 from core.handle.abortHandle import handleAbortMessage
 from core.handle.intentHandler import handle_user_intent
 from core.utils.output_counter import check_device_output_limit
@@ -18,10 +18,10 @@ async def handleAudioMessage(conn: "ConnectionHandler", pcm_frame):
     # 当前片段是否有人说话
     have_voice = conn.vad.is_vad(conn, pcm_frame)
     # 如果设备刚刚被唤醒，短暂忽略VAD检测
-    if hasattr(conn, "just_woken_up") and conn.just_woken_up:
+    if conn.just_woken_up:
         have_voice = False
         # 设置一个短暂延迟后恢复VAD检测
-        if not hasattr(conn, "vad_resume_task") or conn.vad_resume_task.done():
+        if conn.vad_resume_task is None or conn.vad_resume_task.done():
             conn.vad_resume_task = asyncio.create_task(resume_vad_detection(conn))
         return
     # 服务端AEC功能需要实时触发打断
@@ -34,6 +34,12 @@ async def handleAudioMessage(conn: "ConnectionHandler", pcm_frame):
     await conn.asr.receive_audio(conn, pcm_frame, have_voice)
 
 
+async def handleAudioMessages(conn: "ConnectionHandler", pcm_frames):
+    # 按到达顺序逐帧处理一批音频，保持与逐帧调度相同的VAD/ASR行为
+    for pcm_frame in pcm_frames:
+        await handleAudioMessage(conn, pcm_frame)
+
+
 async def resume_vad_detection(conn: "ConnectionHandler"):
     # 等待2秒后恢复VAD检测
     await asyncio.sleep(2)
@@ -47,7 +53,8 @@ async def startToChat(conn: "ConnectionHandler", text):
 
     try:
         # 尝试解析JSON格式的输入
-        if text.strip().startswith("{") and text.strip().endswith("}"):
+        stripped_text = text.strip()
+        if stripped_text.startswith("{") and stripped_text.endswith("}"):
             data = json.loads(text)
             if "speaker" in data and "content" in data:
                 speaker_name = data["speaker"]
@@ -105,17 +112,14 @@ async def startToChat(conn: "ConnectionHandler", text):
 
 async def no_voice_close_connect(conn: "ConnectionHandler", have_voice):
     if have_voice:
-        conn.last_activity_time = time.time() * 1000
+        conn.update_activity_time()
         return
     # 只有在已经初始化过时间戳的情况下才进行超时检查
     if conn.last_activity_time > 0.0:
-        no_voice_time = time.time() * 1000 - conn.last_activity_time
-        close_connection_no_voice_time = int(
-            conn.config.get("close_connection_no_voice_time", 120)
-        )
+        no_voice_time = time.monotonic() - conn.last_activity_time
         if (
             not conn.close_after_chat
-            and no_voice_time > 1000 * close_connection_no_voice_time
+            and no_voice_time > conn.close_no_voice_seconds
         ):
             conn.close_after_chat = True
             conn.client_abort = False
@@ -136,7 +140,7 @@ async def max_out_size(conn: "ConnectionHandler"):
     text = "不好意思，我现在有点事情要忙，明天这个时候我们再聊，约好了哦！明天不见不散，拜拜！"
     await send_stt_message(conn, text)
     file_path = "config/assets/max_output_size.wav"
-    opus_packets = await audio_to_data(file_path)
+    opus_packets = await static_audio_to_data(file_path)
     conn.tts.tts_audio_queue.put((SentenceType.LAST, opus_packets, text))
     conn.close_after_chat = True
 
@@ -155,7 +159,7 @@ async def check_bind_device(conn: "ConnectionHandler"):
 
         # 播放提示音
         music_path = "config/assets/bind_code.wav"
-        opus_packets = await audio_to_data(music_path)
+        opus_packets = await static_audio_to_data(music_path)
         conn.tts.tts_audio_queue.put((SentenceType.FIRST, opus_packets, text))
 
         # 逐个播放数字
@@ -163,7 +167,7 @@ async def check_bind_device(conn: "ConnectionHandler"):
             try:
                 digit = conn.bind_code[i]
                 num_path = f"config/assets/bind_code/{digit}.wav"
-                num_packets = await audio_to_data(num_path)
+                num_packets = await static_audio_to_data(num_path)
                 conn.tts.tts_audio_queue.put((SentenceType.MIDDLE, num_packets, None))
             except Exception as e:
                 conn.logger.bind(tag=TAG).error(f"播放数字音频失败: {e}")
@@ -175,5 +179,5 @@ async def check_bind_device(conn: "ConnectionHandler"):
         text = f"没有找到该设备的版本信息，请正确配置 OTA地址，然后重新编译固件。"
         await send_stt_message(conn, text)
         music_path = "config/assets/bind_not_found.wav"
-        opus_packets = await audio_to_data(music_path)
+        opus_packets = await static_audio_to_data(music_path)
         conn.tts.tts_audio_queue.put((SentenceType.LAST, opus_packets, text))
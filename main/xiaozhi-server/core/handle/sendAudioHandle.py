@@ -30,10 +30,8 @@ async def sendAudioMessage(conn: "ConnectionHandler", sentenceType, audios, text
     if sentenceType == SentenceType.FIRST:
         # 同一句子的后续消息加入流控队列，其他情况立即发送
         if (
-            hasattr(conn, "audio_rate_controller")
-            and conn.audio_rate_controller
-            and getattr(conn, "audio_flow_control", {}).get("sentence_id")
-            == conn.sentence_id
+            conn.audio_rate_controller
+            and conn.audio_flow_control.get("sentence_id") == conn.sentence_id
         ):
             conn.audio_rate_controller.add_message(
                 lambda: send_tts_message(conn, "sentence_start", text)
@@ -62,7 +60,7 @@ async def _wait_for_audio_completion(conn: "ConnectionHandler"):
     Args:
         conn: 连接对象
     """
-    if hasattr(conn, "audio_rate_controller") and conn.audio_rate_controller:
+    if conn.audio_rate_controller:
         rate_controller = conn.audio_rate_controller
         conn.logger.bind(tag=TAG).debug(
             f"等待音频发送完成，队列中还有 {len(rate_controller.queue)} 个包"
@@ -161,12 +159,11 @@ def _get_or_create_rate_controller(
     # 检查是否需要重置控制器
     need_reset = False
 
-    if not hasattr(conn, "audio_rate_controller"):
+    rate_controller = conn.audio_rate_controller
+    if rate_controller is None:
         # 控制器不存在，需要创建
         need_reset = True
     else:
-        rate_controller = conn.audio_rate_controller
-
         # 后台发送任务已停止, 则需要重置
         if (
             not rate_controller.pending_send_task
@@ -174,18 +171,15 @@ def _get_or_create_rate_controller(
         ):
             need_reset = True
         # 当sentence_id 变化，需要重置
-        elif (
-            getattr(conn, "audio_flow_control", {}).get("sentence_id")
-            != conn.sentence_id
-        ):
+        elif conn.audio_flow_control.get("sentence_id") != conn.sentence_id:
             need_reset = True
 
     if need_reset:
         # 创建或获取 rate_controller
-        if not hasattr(conn, "audio_rate_controller"):
+        if rate_controller is None:
             conn.audio_rate_controller = AudioRateController(frame_duration)
         else:
-            conn.audio_rate_controller.reset()
+            rate_controller.reset()
 
         # 初始化 flow_control
         conn.audio_flow_control = {
@@ -217,7 +211,7 @@ def _start_background_sender(conn: "ConnectionHandler", rate_controller, flow_co
         if conn.client_abort:
             raise asyncio.CancelledError("客户端已中止")
 
-        conn.last_activity_time = time.time() * 1000
+        conn.update_activity_time()
         await _do_send_audio(conn, packet, flow_control)
 
     # 使用 start_sending 启动后台循环
@@ -241,7 +235,7 @@ async def _send_audio_with_rate_control(
         if conn.client_abort:
             return
 
-        conn.last_activity_time = time.time() * 1000
+        conn.update_activity_time()
 
         # 预缓冲：前N个包直接发送
         if flow_control["packet_count"] < PRE_BUFFER_COUNT:
@@ -304,7 +298,7 @@ async def send_tts_message(conn: "ConnectionHandler", state, text=None):
             return
 
         # 停止音频发送循环（仅在流控器已初始化时调用）
-        if hasattr(conn, "audio_rate_controller") and conn.audio_rate_controller:
+        if conn.audio_rate_controller:
             conn.audio_rate_controller.stop_sending()
         conn.clearSpeakStatus()
 
@@ -323,7 +317,8 @@ async def send_stt_message(conn: "ConnectionHandler", text):
     display_text = text
     try:
         # 尝试解析JSON格式
-        if text.strip().startswith("{") and text.strip().endswith("}"):
+        stripped_text = text.strip()
+        if stripped_text.startswith("{") and stripped_text.endswith("}"):
             parsed_data = json.loads(text)
             if isinstance(parsed_data, dict) and "content" in parsed_data:
                 # 如果是包含说话人信息的JSON格式，只显示content部分
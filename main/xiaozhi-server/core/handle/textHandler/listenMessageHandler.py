@@ -1,3 +1,4 @@
+import sys
 import time
 import uuid
 import asyncio
@@ -28,7 +29,8 @@ class ListenTextMessageHandler(TextMessageHandler):
 
     async def handle(self, conn: "ConnectionHandler", msg_json: Dict[str, Any]) -> None:
         if "mode" in msg_json:
-            conn.client_listen_mode = msg_json["mode"]
+            mode = msg_json["mode"]
+            conn.client_listen_mode = sys.intern(mode) if isinstance(mode, str) else mode
             conn.logger.bind(tag=TAG).debug(
                 f"客户端拾音模式：{conn.client_listen_mode}"
             )
@@ -56,7 +58,7 @@ class ListenTextMessageHandler(TextMessageHandler):
             conn.client_have_voice = False
             conn.reset_audio_states()
             if "text" in msg_json:
-                conn.last_activity_time = time.time() * 1000
+                conn.update_activity_time()
                 original_text = msg_json["text"]  # 保留原始文本
                 filtered_len, filtered_text = remove_punctuation_and_length(
                     original_text
@@ -94,7 +96,7 @@ class ListenTextMessageHandler(TextMessageHandler):
                     return
 
                 # 识别是否是唤醒词
-                is_wakeup_words = filtered_text in conn.config.get("wakeup_words")
+                is_wakeup_words = filtered_text in conn.wakeup_words
                 # 是否开启唤醒词回复
                 enable_greeting = conn.config.get("enable_greeting", True)
 
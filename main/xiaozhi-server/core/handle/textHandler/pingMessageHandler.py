@@ -31,7 +31,7 @@ class PingMessageHandler(TextMessageHandler):
 
         try:
             conn.logger.debug(f"收到PING消息，发送PONG响应")
-            conn.last_activity_time = time.time() * 1000
+            conn.update_activity_time()
             # 构造PONG响应消息
             pong_message = {
                 "type": "pong",
@@ -24,8 +24,11 @@ class TextMessageProcessor:
             if isinstance(msg_json, dict):
                 message_type = msg_json.get("type")
 
-                # 记录日志
-                conn.logger.bind(tag=TAG).info(f"收到{message_type}消息：{message}")
+                # 记录日志（心跳消息频繁且内容固定，只在debug级别输出）
+                if message_type == "ping":
+                    conn.logger.bind(tag=TAG).debug("收到ping消息：{}", message)
+                else:
+                    conn.logger.bind(tag=TAG).info(f"收到{message_type}消息：{message}")
 
                 # 获取并执行处理器
                 handler = self.registry.get_handler(message_type)
@@ -178,7 +178,7 @@ class ASRProvider(ASRProviderBase):
             conn = http.client.HTTPSConnection(self.host)
             request_url = self._construct_request_url()
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None,
                 lambda: conn.request(
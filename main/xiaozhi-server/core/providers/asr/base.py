@@ -17,7 +17,7 @@ from core.providers.asr.dto.dto import InterfaceType
 from core.handle.receiveAudioHandle import startToChat
 from core.handle.reportHandle import enqueue_asr_report
 from core.utils.util import remove_punctuation_and_length
-from core.handle.receiveAudioHandle import handleAudioMessage
+from core.handle.receiveAudioHandle import handleAudioMessages
 from typing import Optional, Tuple, List, NamedTuple, TYPE_CHECKING
 
 
@@ -27,6 +27,9 @@ if TYPE_CHECKING:
 TAG = __name__
 logger = setup_logging()
 
+# 单次调度到事件循环处理的最大音频帧数
+ASR_AUDIO_BATCH_SIZE = 8
+
 
 class ASRProviderBase(ABC):
     def __init__(self):
@@ -43,9 +46,15 @@ class ASRProviderBase(ABC):
     def asr_text_priority_thread(self, conn: "ConnectionHandler"):
         while not conn.stop_event.is_set():
             try:
-                message = conn.asr_audio_queue.get(timeout=1)
+                pcm_frames = [conn.asr_audio_queue.get(timeout=1)]
+                # 顺带取出已积压的音频帧，合并为一次跨线程调度，不额外等待新帧
+                while len(pcm_frames) < ASR_AUDIO_BATCH_SIZE:
+                    try:
+                        pcm_frames.append(conn.asr_audio_queue.get_nowait())
+                    except queue.Empty:
+                        break
                 future = asyncio.run_coroutine_threadsafe(
-                    handleAudioMessage(conn, message),
+                    handleAudioMessages(conn, pcm_frames),
                     conn.loop,
                 )
                 future.result()
@@ -8,6 +8,7 @@ from typing import Optional, Tuple, List
 from core.providers.asr.base import ASRProviderBase
 from core.providers.asr.utils import lang_tag_filter
 from core.providers.asr.dto.dto import InterfaceType
+from core.utils.util import parse_bool
 
 TAG = __name__
 logger = setup_logging()
@@ -25,11 +26,7 @@ class ASRProvider(ASRProviderBase):
         self.host = config.get("host", "localhost")
         self.port = config.get("port", 10095)
         self.api_key = config.get("api_key", "none")
-        self.is_ssl = str(config.get("is_ssl", True)).lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.is_ssl = parse_bool(config.get("is_ssl", True))
         self.output_dir = config.get("output_dir")
         self.delete_audio_file = delete_audio_file
         self.uri = (
@@ -21,6 +21,10 @@ class LLMProviderBase(ABC):
             result += part
         return result
     
+    def close_session(self, session_id):
+        """连接关闭时清理该会话的状态，保存了会话映射的提供者需要重写"""
+        pass
+
     def response_with_functions(self, session_id, dialogue, functions=None):
         """
         Default implementation for function calling (streaming)
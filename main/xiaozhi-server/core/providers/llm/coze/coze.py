@@ -27,6 +27,10 @@ class LLMProvider(LLMProviderBase):
         if model_key_msg:
             logger.bind(tag=TAG).error(model_key_msg)
 
+    def close_session(self, session_id):
+        # 连接关闭后不再需要该会话的conversation_id
+        self.session_conversation_map.pop(session_id, None)
+
     def response(self, session_id, dialogue, **kwargs):
         coze_api_token = self.personal_access_token
         coze_api_base = COZE_CN_BASE_URL
@@ -19,6 +19,10 @@ class LLMProvider(LLMProviderBase):
         if model_key_msg:
             logger.bind(tag=TAG).error(model_key_msg)
 
+    def close_session(self, session_id):
+        # 连接关闭后不再需要该会话的conversation_id
+        self.session_conversation_map.pop(session_id, None)
+
     def response(self, session_id, dialogue, **kwargs):
         # 取最后一条用户消息
         last_msg = next(m for m in reversed(dialogue) if m["role"] == "user")
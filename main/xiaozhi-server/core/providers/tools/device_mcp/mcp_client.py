@@ -47,8 +47,8 @@ class MCPClient:
         return result
 
     async def is_ready(self) -> bool:
-        async with self.lock:
-            return self.ready
+        # 单个布尔值的读取在事件循环内是原子的，且持锁方不会在临界区内让出，无需加锁
+        return self.ready
 
     async def set_ready(self, status: bool):
         async with self.lock:
@@ -21,6 +21,7 @@ from config.logger import setup_logging
 from core.utils.util import sanitize_tool_name
 
 TAG = __name__
+logger = setup_logging()
 
 
 class ServerMCPClient:
@@ -32,7 +33,7 @@ class ServerMCPClient:
         Args:
             config: MCP服务配置字典
         """
-        self.logger = setup_logging()
+        self.logger = logger
         self.config = config
 
         self._worker_task: Optional[asyncio.Task] = None
@@ -176,15 +176,27 @@ class ServerMCPManager:
 
     async def cleanup_all(self) -> None:
         """关闭所有 MCP客户端"""
-        for name, client in list(self.clients.items()):
-            try:
-                if hasattr(client, "cleanup"):
-                    await asyncio.wait_for(client.cleanup(), timeout=20)
-                logger.bind(tag=TAG).info(f"服务端MCP客户端已关闭: {name}")
-            except (asyncio.TimeoutError, Exception) as e:
-                logger.bind(tag=TAG).error(f"关闭服务端MCP客户端 {name} 时出错: {e}")
+        # 多数连接未配置服务端MCP，没有客户端时直接返回
+        if not self.clients:
+            return
+        # 各客户端由自己的工作任务持有连接，彼此独立，并发关闭避免耗时累加
+        await asyncio.gather(
+            *(
+                self._cleanup_client(name, client)
+                for name, client in list(self.clients.items())
+            )
+        )
         self.clients.clear()
 
+    async def _cleanup_client(self, name: str, client) -> None:
+        """关闭单个 MCP客户端"""
+        try:
+            if hasattr(client, "cleanup"):
+                await asyncio.wait_for(client.cleanup(), timeout=20)
+            logger.bind(tag=TAG).info(f"服务端MCP客户端已关闭: {name}")
+        except (asyncio.TimeoutError, Exception) as e:
+            logger.bind(tag=TAG).error(f"关闭服务端MCP客户端 {name} 时出错: {e}")
+
     # 可选回调方法
 
     async def logging_callback(self, params: LoggingMessageNotificationParams):
@@ -1,6 +1,7 @@
 """统一工具处理器"""
 
 import json
+import asyncio
 from typing import Dict, List, Any, Optional
 from config.logger import setup_logging
 from plugins_func.loadplugins import auto_import_modules
@@ -15,6 +16,8 @@ from .device_mcp import DeviceMCPExecutor
 from .mcp_endpoint import MCPEndpointExecutor
 from core.handle.sendAudioHandle import send_display_message
 
+logger = setup_logging()
+
 
 class UnifiedToolHandler:
     """统一工具处理器"""
@@ -22,7 +25,7 @@ class UnifiedToolHandler:
     def __init__(self, conn):
         self.conn = conn
         self.config = conn.config
-        self.logger = setup_logging()
+        self.logger = logger
 
         # 创建工具管理器
         self.tool_manager = ToolManager(conn)
@@ -166,7 +169,7 @@ class UnifiedToolHandler:
                         response="无法解析函数参数",
                     )
 
-            self.logger.debug(f"调用函数: {function_name}, 参数: {arguments}")
+            self.logger.debug("调用函数: {}, 参数: {}", function_name, arguments)
 
             # 发送工具调用显示消息到设备
             try:
@@ -228,14 +231,20 @@ class UnifiedToolHandler:
     async def cleanup(self):
         """清理资源"""
         try:
-            await self.server_mcp_executor.cleanup()
+            cleanup_coros = [self.server_mcp_executor.cleanup()]
 
             # 清理MCP接入点连接
             if (
                 hasattr(self.conn, "mcp_endpoint_client")
                 and self.conn.mcp_endpoint_client
             ):
-                await self.conn.mcp_endpoint_client.close()
+                cleanup_coros.append(self.conn.mcp_endpoint_client.close())
+
+            # 服务端MCP与MCP接入点互不依赖，并发关闭
+            results = await asyncio.gather(*cleanup_coros, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"工具处理器清理失败: {result}")
 
             self.logger.info("工具处理器清理完成")
         except Exception as e:
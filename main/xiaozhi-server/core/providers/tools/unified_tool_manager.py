@@ -5,13 +5,15 @@ from config.logger import setup_logging
 from plugins_func.register import Action, ActionResponse
 from .base import ToolType, ToolDefinition, ToolExecutor
 
+logger = setup_logging()
+
 
 class ToolManager:
     """统一工具管理器，管理所有类型的工具"""
 
     def __init__(self, conn):
         self.conn = conn
-        self.logger = setup_logging()
+        self.logger = logger
         self.executors: Dict[ToolType, ToolExecutor] = {}
         self._cached_tools: Optional[Dict[str, ToolDefinition]] = None
         self._cached_function_descriptions: Optional[List[Dict[str, Any]]] = None
@@ -68,9 +68,7 @@ class TTSProviderBase(ABC):
             self._words_by_first_char = {}
             for key in sorted_keys:  # 使用已按长度降序排列的keys，确保长词优先匹配
                 first_char = key[0] if key else ""
-                if first_char not in self._words_by_first_char:
-                    self._words_by_first_char[first_char] = []
-                self._words_by_first_char[first_char].append(key)
+                self._words_by_first_char.setdefault(first_char, []).append(key)
         else:
             self._correct_words_pattern = None
             self._reverse_words_pattern = None
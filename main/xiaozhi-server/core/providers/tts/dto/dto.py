@@ -24,6 +24,15 @@ class InterfaceType(Enum):
 
 
 class TTSMessageDTO:
+    # 每个LLM输出片段都会创建一个实例，使用__slots__省去实例字典
+    __slots__ = (
+        "sentence_id",
+        "sentence_type",
+        "content_type",
+        "content_detail",
+        "content_file",
+    )
+
     def __init__(
         self,
         sentence_id: str,
@@ -5,7 +5,7 @@ from pathlib import Path
 from pydantic import BaseModel, Field, conint, model_validator
 from typing_extensions import Annotated
 from typing import Literal
-from core.utils.util import check_model_key, parse_string_to_list
+from core.utils.util import check_model_key, parse_string_to_list, parse_bool
 from core.providers.tts.base import TTSProviderBase
 from config.logger import setup_logging
 
@@ -97,11 +97,7 @@ class TTSProvider(TTSProviderBase):
         if model_key_msg:
             logger.bind(tag=TAG).error(model_key_msg)
             return
-        self.normalize = str(config.get("normalize", True)).lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.normalize = parse_bool(config.get("normalize", True))
 
         # 处理空字符串的情况
         channels = config.get("channels", "1")
@@ -125,11 +121,7 @@ class TTSProvider(TTSProviderBase):
             float(repetition_penalty) if repetition_penalty else 1.2
         )
 
-        self.streaming = str(config.get("streaming", False)).lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.streaming = parse_bool(config.get("streaming", False))
         self.use_memory_cache = config.get("use_memory_cache", "on")
         self.seed = int(config.get("seed")) if config.get("seed") else None
         self.api_url = config.get("api_url", "http://127.0.0.1:8080/v1/tts")
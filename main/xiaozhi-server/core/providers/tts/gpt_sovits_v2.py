@@ -1,7 +1,7 @@
 import requests
 from config.logger import setup_logging
 from core.providers.tts.base import TTSProviderBase
-from core.utils.util import parse_string_to_list
+from core.utils.util import parse_string_to_list, parse_bool
 
 TAG = __name__
 logger = setup_logging()
@@ -39,28 +39,12 @@ class TTSProvider(TTSProviderBase):
 
         self.text_split_method = config.get("text_split_method", "cut0")
 
-        self.split_bucket = str(config.get("split_bucket", True)).lower() in (
-            "true",
-            "1",
-            "yes",
-        )
-        self.return_fragment = str(config.get("return_fragment", False)).lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.split_bucket = parse_bool(config.get("split_bucket", True))
+        self.return_fragment = parse_bool(config.get("return_fragment", False))
 
-        self.streaming_mode = str(config.get("streaming_mode", False)).lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.streaming_mode = parse_bool(config.get("streaming_mode", False))
 
-        self.parallel_infer = str(config.get("parallel_infer", True)).lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        self.parallel_infer = parse_bool(config.get("parallel_infer", True))
 
         self.aux_ref_audio_paths = parse_string_to_list(
             config.get("aux_ref_audio_paths")
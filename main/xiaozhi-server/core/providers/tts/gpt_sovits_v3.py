@@ -1,7 +1,7 @@
 import requests
 from config.logger import setup_logging
 from core.providers.tts.base import TTSProviderBase
-from core.utils.util import parse_string_to_list
+from core.utils.util import parse_string_to_list, parse_bool
 
 TAG = __name__
 logger = setup_logging()
@@ -31,7 +31,7 @@ class TTSProvider(TTSProviderBase):
 
         self.cut_punc = config.get("cut_punc", "")
         self.inp_refs = parse_string_to_list(config.get("inp_refs"))
-        self.if_sr = str(config.get("if_sr", False)).lower() in ("true", "1", "yes")
+        self.if_sr = parse_bool(config.get("if_sr", False))
         self.audio_file_type = config.get("format", "wav")
 
     async def text_to_speak(self, text, output_file):
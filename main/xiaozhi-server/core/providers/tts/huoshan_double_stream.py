@@ -675,8 +675,9 @@ class TTSProvider(TTSProviderBase):
         return await self.send_event(self.ws, header, optional, payload)
 
     def print_response(self, res, tag_msg: str):
-        logger.bind(tag=TAG).debug(f"===>{tag_msg} header:{res.header.__dict__}")
-        logger.bind(tag=TAG).debug(f"===>{tag_msg} optional:{res.optional.__dict__}")
+        # 每个响应帧都会调用，使用参数形式交给 loguru 格式化，未启用 DEBUG 时不生成字符串
+        logger.bind(tag=TAG).debug("===>{} header:{}", tag_msg, res.header.__dict__)
+        logger.bind(tag=TAG).debug("===>{} optional:{}", tag_msg, res.optional.__dict__)
 
     def get_payload_bytes(
         self,
@@ -751,7 +752,7 @@ class TTSProvider(TTSProviderBase):
             asyncio.set_event_loop(loop)
 
             # 生成会话ID
-            session_id = uuid.uuid4().__str__().replace("-", "")
+            session_id = uuid.uuid4().hex
 
             # 存储音频数据
             audio_data = []
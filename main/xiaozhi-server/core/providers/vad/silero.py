@@ -33,6 +33,8 @@ class VADProvider(VADProviderBase):
         self.silence_threshold_ms = (
             int(min_silence_duration_ms) if min_silence_duration_ms else 1000
         )
+        # 静默判断使用单调时钟（秒），预先换算避免每帧做单位转换
+        self.silence_threshold_s = self.silence_threshold_ms / 1000
 
         self.frame_window_threshold = 3
 
@@ -46,11 +48,11 @@ class VADProvider(VADProviderBase):
     def release_conn_resources(self, conn):
         """释放连接的 VAD 资源（连接关闭时调用）"""
         for attr in ("_vad_state", "_vad_context"):
-            if hasattr(conn, attr):
-                try:
-                    delattr(conn, attr)
-                except Exception:
-                    pass
+            # 直接删除，不存在时忽略，避免先hasattr再delattr的重复查找
+            try:
+                delattr(conn, attr)
+            except AttributeError:
+                pass
 
     def is_vad(self, conn, pcm_frame):
         # 手动模式：直接返回True，不进行实时VAD检测，所有音频都缓存
@@ -66,7 +68,8 @@ class VADProvider(VADProviderBase):
             client_have_voice = False
             while len(conn.client_audio_buffer) >= 512 * 2:
                 chunk = conn.client_audio_buffer[: 512 * 2]
-                conn.client_audio_buffer = conn.client_audio_buffer[512 * 2 :]
+                # 原地删除已取出的数据，复用缓冲区而不是每个分块都重新分配
+                del conn.client_audio_buffer[: 512 * 2]
 
                 audio_int16 = np.frombuffer(chunk, dtype=np.int16)
                 audio_float32 = audio_int16.astype(np.float32) / 32768.0
@@ -96,20 +99,25 @@ class VADProvider(VADProviderBase):
                 # 声音没低于最低值则延续前一个状态，判断为有声音
                 conn.last_is_voice = is_voice
 
-                # 更新滑动窗口
-                conn.client_voice_window.append(is_voice)
+                # 更新滑动窗口，同步维护窗口内有声帧计数，无需每帧重新统计
+                voice_window = conn.client_voice_window
+                if len(voice_window) == voice_window.maxlen and voice_window[0]:
+                    conn.client_voice_count -= 1
+                voice_window.append(is_voice)
+                if is_voice:
+                    conn.client_voice_count += 1
                 client_have_voice = (
-                    conn.client_voice_window.count(True) >= self.frame_window_threshold
+                    conn.client_voice_count >= self.frame_window_threshold
                 )
 
                 # 如果之前有声音，但本次没有声音，且与上次有声音的时间差已经超过了静默阈值，则认为已经说完一句话
                 if conn.client_have_voice and not client_have_voice:
-                    stop_duration = time.time() * 1000 - conn.vad_last_voice_time
-                    if stop_duration >= self.silence_threshold_ms:
+                    stop_duration = time.monotonic() - conn.vad_last_voice_time
+                    if stop_duration >= self.silence_threshold_s:
                         conn.client_voice_stop = True
                 if client_have_voice:
                     conn.client_have_voice = True
-                    conn.vad_last_voice_time = time.time() * 1000
+                    conn.vad_last_voice_time = time.monotonic()
 
             return client_have_voice
         except Exception as e:
@@ -1,7 +1,4 @@
-import importlib
 import logging
-import os
-import sys
 import time
 import wave
 import uuid
@@ -9,16 +6,14 @@ from abc import ABC, abstractmethod
 from typing import Optional, Tuple, List
 from core.providers.asr.base import ASRProviderBase
 from config.logger import setup_logging
+from core.utils.provider_loader import load_provider_class
 
 TAG = __name__
 logger = setup_logging()
 
 def create_instance(class_name: str, *args, **kwargs) -> ASRProviderBase:
     """工厂方法创建ASR实例"""
-    if os.path.exists(os.path.join('core', 'providers', 'asr', f'{class_name}.py')):
-        lib_name = f'core.providers.asr.{class_name}'
-        if lib_name not in sys.modules:
-            sys.modules[lib_name] = importlib.import_module(f'{lib_name}')
-        return sys.modules[lib_name].ASRProvider(*args, **kwargs)
-
-    raise ValueError(f"不支持的ASR类型: {class_name}，请检查该配置的type是否设置正确")
\ No newline at end of file
+    provider_class = load_provider_class("asr", class_name, "ASRProvider")
+    if provider_class is None:
+        raise ValueError(f"不支持的ASR类型: {class_name}，请检查该配置的type是否设置正确")
+    return provider_class(*args, **kwargs)
\ No newline at end of file
@@ -20,11 +20,12 @@ class CacheType(Enum):
     DEVICE_PROMPT = "device_prompt"
     VOICEPRINT_HEALTH = "voiceprint_health"  # 声纹识别健康检查
     AUDIO_DATA = "audio_data"  # 音频数据缓存
+    LLM_RESPONSE = "llm_response"  # 大模型回复缓存
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CacheConfig:
-    """缓存配置类"""
+    """缓存配置类（不可变，预设配置在各缓存空间之间共享）"""
 
     strategy: CacheStrategy = CacheStrategy.TTL
     ttl: Optional[float] = 300  # 默认5分钟
@@ -34,33 +35,41 @@ class CacheConfig:
     @classmethod
     def for_type(cls, cache_type: CacheType) -> "CacheConfig":
         """根据缓存类型返回预设配置"""
-        configs = {
-            CacheType.LOCATION: cls(
-                strategy=CacheStrategy.TTL, ttl=None, max_size=1000  # 手动失效
-            ),
-            CacheType.IP_INFO: cls(
-                strategy=CacheStrategy.TTL, ttl=86400, max_size=1000  # 24小时
-            ),
-            CacheType.WEATHER: cls(
-                strategy=CacheStrategy.TTL, ttl=28800, max_size=1000  # 8小时
-            ),
-            CacheType.LUNAR: cls(
-                strategy=CacheStrategy.TTL, ttl=2592000, max_size=365  # 30天过期
-            ),
-            CacheType.INTENT: cls(
-                strategy=CacheStrategy.TTL_LRU, ttl=600, max_size=1000  # 10分钟
-            ),
-            CacheType.CONFIG: cls(
-                strategy=CacheStrategy.FIXED_SIZE, ttl=None, max_size=20  # 手动失效
-            ),
-            CacheType.DEVICE_PROMPT: cls(
-                strategy=CacheStrategy.TTL, ttl=None, max_size=1000  # 手动失效
-            ),
-            CacheType.VOICEPRINT_HEALTH: cls(
-                strategy=CacheStrategy.TTL, ttl=600, max_size=100  # 10分钟过期
-            ),
-            CacheType.AUDIO_DATA: cls(
-                strategy=CacheStrategy.TTL, ttl=600, max_size=100  # 10分钟过期
-            ),
-        }
-        return configs.get(cache_type, cls())
+        return _PRESET_CONFIGS.get(cache_type, _DEFAULT_CONFIG)
+
+
+_DEFAULT_CONFIG = CacheConfig()
+
+# 各缓存类型的预设配置，模块加载时创建一次
+_PRESET_CONFIGS: Dict[CacheType, CacheConfig] = {
+    CacheType.LOCATION: CacheConfig(
+        strategy=CacheStrategy.TTL, ttl=None, max_size=1000  # 手动失效
+    ),
+    CacheType.IP_INFO: CacheConfig(
+        strategy=CacheStrategy.TTL, ttl=86400, max_size=1000  # 24小时
+    ),
+    CacheType.WEATHER: CacheConfig(
+        strategy=CacheStrategy.TTL, ttl=28800, max_size=1000  # 8小时
+    ),
+    CacheType.LUNAR: CacheConfig(
+        strategy=CacheStrategy.TTL, ttl=2592000, max_size=365  # 30天过期
+    ),
+    CacheType.INTENT: CacheConfig(
+        strategy=CacheStrategy.TTL_LRU, ttl=600, max_size=1000  # 10分钟
+    ),
+    CacheType.CONFIG: CacheConfig(
+        strategy=CacheStrategy.FIXED_SIZE, ttl=None, max_size=20  # 手动失效
+    ),
+    CacheType.DEVICE_PROMPT: CacheConfig(
+        strategy=CacheStrategy.TTL, ttl=None, max_size=1000  # 手动失效
+    ),
+    CacheType.VOICEPRINT_HEALTH: CacheConfig(
+        strategy=CacheStrategy.TTL, ttl=600, max_size=100  # 10分钟过期
+    ),
+    CacheType.AUDIO_DATA: CacheConfig(
+        strategy=CacheStrategy.TTL, ttl=600, max_size=100  # 10分钟过期
+    ),
+    CacheType.LLM_RESPONSE: CacheConfig(
+        strategy=CacheStrategy.TTL_LRU, ttl=600, max_size=1000  # 10分钟
+    ),
+}
@@ -9,6 +9,12 @@ from collections import OrderedDict
 from .strategies import CacheStrategy, CacheEntry
 from .config import CacheConfig, CacheType
 
+# 使用LRU淘汰的策略
+_LRU_STRATEGIES = frozenset((CacheStrategy.LRU, CacheStrategy.TTL_LRU))
+
+# 缓存类型到缓存名称的映射，导入时计算一次，避免每次访问都走 Enum.value 描述符
+_CACHE_TYPE_NAMES = {cache_type: cache_type.value for cache_type in CacheType}
+
 
 class GlobalCacheManager:
     """全局缓存管理器"""
@@ -33,24 +39,24 @@ class GlobalCacheManager:
 
     def _get_cache_name(self, cache_type: CacheType, namespace: str = "") -> str:
         """生成缓存名称"""
+        cache_name = _CACHE_TYPE_NAMES[cache_type]
         if namespace:
-            return f"{cache_type.value}:{namespace}"
-        return cache_type.value
+            return f"{cache_name}:{namespace}"
+        return cache_name
 
     def _get_or_create_cache(
         self, cache_name: str, config: CacheConfig
     ) -> Dict[str, CacheEntry]:
         """获取或创建缓存空间"""
         with self._global_lock:
-            if cache_name not in self._caches:
-                self._caches[cache_name] = (
-                    OrderedDict()
-                    if config.strategy in [CacheStrategy.LRU, CacheStrategy.TTL_LRU]
-                    else {}
-                )
+            cache = self._caches.get(cache_name)
+            if cache is None:
+                cache = OrderedDict() if config.strategy in _LRU_STRATEGIES else {}
                 self._configs[cache_name] = config
                 self._locks[cache_name] = threading.RLock()
-            return self._caches[cache_name]
+                # 最后再发布缓存空间，无锁读取方看到缓存时其配置和锁已就绪
+                self._caches[cache_name] = cache
+            return cache
 
     def set(
         self,
@@ -73,17 +79,15 @@ class GlobalCacheManager:
             entry = CacheEntry(value=value, timestamp=time.time(), ttl=effective_ttl)
 
             # 处理不同策略
-            if config.strategy in [CacheStrategy.LRU, CacheStrategy.TTL_LRU]:
-                # LRU策略：如果已存在则移动到末尾
-                if key in cache:
-                    del cache[key]
+            if config.strategy in _LRU_STRATEGIES:
+                # LRU策略：写入后移动到末尾
                 cache[key] = entry
+                cache.move_to_end(key)
 
                 # 检查大小限制
                 if config.max_size and len(cache) > config.max_size:
                     # 移除最旧的条目
-                    oldest_key = next(iter(cache))
-                    del cache[oldest_key]
+                    cache.popitem(last=False)
                     self._stats["evictions"] += 1
 
             else:
@@ -105,20 +109,20 @@ class GlobalCacheManager:
         """获取缓存值"""
         cache_name = self._get_cache_name(cache_type, namespace)
 
-        if cache_name not in self._caches:
+        # 每个字典只查找一次，命中路径上不重复计算哈希
+        cache = self._caches.get(cache_name)
+        if cache is None:
             self._stats["misses"] += 1
             return None
 
-        cache = self._caches[cache_name]
         config = self._configs[cache_name]
 
         with self._locks[cache_name]:
-            if key not in cache:
+            entry = cache.get(key)
+            if entry is None:
                 self._stats["misses"] += 1
                 return None
 
-            entry = cache[key]
-
             # 检查过期
             if entry.is_expired():
                 del cache[key]
@@ -129,9 +133,8 @@ class GlobalCacheManager:
             entry.touch()
 
             # LRU策略：移动到末尾
-            if config.strategy in [CacheStrategy.LRU, CacheStrategy.TTL_LRU]:
-                del cache[key]
-                cache[key] = entry
+            if config.strategy in _LRU_STRATEGIES:
+                cache.move_to_end(key)
 
             self._stats["hits"] += 1
             return entry.value
@@ -140,16 +143,12 @@ class GlobalCacheManager:
         """删除缓存条目"""
         cache_name = self._get_cache_name(cache_type, namespace)
 
-        if cache_name not in self._caches:
+        cache = self._caches.get(cache_name)
+        if cache is None:
             return False
 
-        cache = self._caches[cache_name]
-
         with self._locks[cache_name]:
-            if key in cache:
-                del cache[key]
-                return True
-            return False
+            return cache.pop(key, None) is not None
 
     def clear(self, cache_type: CacheType, namespace: str = "") -> None:
         """清空指定缓存"""
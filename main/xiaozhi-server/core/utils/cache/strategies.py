@@ -17,7 +17,7 @@ class CacheStrategy(Enum):
     TTL_LRU = "ttl_lru"  # TTL + LRU混合策略
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """缓存条目数据结构"""
 
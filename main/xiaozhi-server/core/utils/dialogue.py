@@ -1,10 +1,19 @@
 import uuid
-import re
 from typing import List, Dict
 from datetime import datetime
 
 
 class Message:
+    # 对话历史中每轮都会创建多条消息，使用 __slots__ 省去实例字典
+    __slots__ = (
+        "uniq_id",
+        "role",
+        "content",
+        "tool_calls",
+        "tool_call_id",
+        "is_temporary",
+    )
+
     def __init__(
             self,
             role: str,
@@ -14,7 +23,7 @@ class Message:
             tool_call_id=None,
             is_temporary=False,
     ):
-        self.uniq_id = uniq_id if uniq_id is not None else str(uuid.uuid4())
+        self.uniq_id = uniq_id if uniq_id is not None else uuid.uuid4().hex
         self.role = role
         self.content = content
         self.tool_calls = tool_calls
@@ -25,8 +34,6 @@ class Message:
 class Dialogue:
     def __init__(self):
         self.dialogue: List[Message] = []
-        # 获取当前时间
-        self.current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def put(self, message: Message):
         self.dialogue.append(message)
@@ -98,7 +105,7 @@ class Dialogue:
         # 构建对话
         dialogue = []
 
-        # 添加系统提示和记忆
+        # 添加系统提示
         system_message = next(
             (msg for msg in self.dialogue if msg.role == "system"), None
         )
@@ -106,20 +113,11 @@ class Dialogue:
         if system_message:
             full_prompt = system_message.content
 
-            # 替换时间占位符
+            # 替换时间占位符，只精确到小时，系统提示词每小时才变化一次，多轮对话可命中前缀缓存
             full_prompt = full_prompt.replace(
-                "{{current_time}}", datetime.now().strftime("%H:%M")
+                "{{current_time}}", datetime.now().strftime("%H:00-%H:59")
             )
 
-            # 填充记忆
-            if memory_str is not None:
-                full_prompt = re.sub(
-                    r"<memory>.*?</memory>",
-                    f"<memory>\n{memory_str}\n</memory>",
-                    full_prompt,
-                    flags=re.DOTALL,
-                )
-
             # 追加说话人信息
             try:
                 current_speaker_name = (current_speaker or "").strip()
@@ -160,4 +158,15 @@ class Dialogue:
         for m in complete_actual:
             self.getMessages(m, dialogue)
 
+        # 记忆可能随提问变化，不放入系统提示词，仅在有记忆时作为用户角色消息放在最后一条用户消息之前，
+        # 使系统提示词与历史对话组成的前缀在多轮之间保持不变；没有记忆时不追加任何消息
+        if memory_str:
+            for i in range(len(dialogue) - 1, -1, -1):
+                if dialogue[i]["role"] == "user":
+                    dialogue.insert(
+                        i,
+                        {"role": "user", "content": f"<memory>\n{memory_str}\n</memory>"},
+                    )
+                    break
+
         return dialogue
@@ -1,17 +1,12 @@
-import os
-import sys
 from config.logger import setup_logging
-import importlib
+from core.utils.provider_loader import load_provider_class
 
 logger = setup_logging()
 
 
 def create_instance(class_name, *args, **kwargs):
     # 创建intent实例
-    if os.path.exists(os.path.join('core', 'providers', 'intent', class_name, f'{class_name}.py')):
-        lib_name = f'core.providers.intent.{class_name}.{class_name}'
-        if lib_name not in sys.modules:
-            sys.modules[lib_name] = importlib.import_module(f'{lib_name}')
-        return sys.modules[lib_name].IntentProvider(*args, **kwargs)
-
-    raise ValueError(f"不支持的intent类型: {class_name}，请检查该配置的type是否设置正确")
\ No newline at end of file
+    provider_class = load_provider_class("intent", class_name, "IntentProvider", nested=True)
+    if provider_class is None:
+        raise ValueError(f"不支持的intent类型: {class_name}，请检查该配置的type是否设置正确")
+    return provider_class(*args, **kwargs)
\ No newline at end of file
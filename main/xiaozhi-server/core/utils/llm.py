@@ -1,5 +1,7 @@
 import os
 import sys
+import json
+import threading
 
 # 添加项目根目录到Python路径
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -7,17 +9,56 @@ project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))
 sys.path.insert(0, project_root)
 
 from config.logger import setup_logging
-import importlib
+from core.utils.provider_loader import load_provider_class
 
 logger = setup_logging()
 
+# 相同类型与配置的LLM实例在各连接间共享，按引用计数管理：{缓存键: [实例, 引用数]}
+# 最后一个使用者释放后即从池中移除，实例的生命周期与使用它的连接一致
+_shared_instances = {}
+_shared_instances_lock = threading.Lock()
+
 
 def create_instance(class_name, *args, **kwargs):
     # 创建LLM实例
-    if os.path.exists(os.path.join('core', 'providers', 'llm', class_name, f'{class_name}.py')):
-        lib_name = f'core.providers.llm.{class_name}.{class_name}'
-        if lib_name not in sys.modules:
-            sys.modules[lib_name] = importlib.import_module(f'{lib_name}')
-        return sys.modules[lib_name].LLMProvider(*args, **kwargs)
+    provider_class = load_provider_class("llm", class_name, "LLMProvider", nested=True)
+    if provider_class is None:
+        raise ValueError(f"不支持的LLM类型: {class_name}，请检查该配置的type是否设置正确")
+    return provider_class(*args, **kwargs)
+
+
+def create_shared_instance(class_name, config):
+    """获取共享的LLM实例，配置相同时复用已创建的实例并增加引用数
+
+    LLM提供者只持有接口地址、密钥等配置，会话状态按session_id区分并在连接关闭时
+    通过 close_session 清理，可以在多个连接之间共享；使用完毕后需调用 release_shared_instance
+    """
+    cache_key = (class_name, json.dumps(config, sort_keys=True, default=str))
+    with _shared_instances_lock:
+        entry = _shared_instances.get(cache_key)
+        if entry is not None:
+            entry[1] += 1
+            return entry[0]
+
+    instance = create_instance(class_name, config)
+    with _shared_instances_lock:
+        # 并发创建时以先放入的实例为准
+        entry = _shared_instances.get(cache_key)
+        if entry is not None:
+            entry[1] += 1
+            return entry[0]
+        _shared_instances[cache_key] = [instance, 1]
+    return instance
+
 
-    raise ValueError(f"不支持的LLM类型: {class_name}，请检查该配置的type是否设置正确")
+def release_shared_instance(instance):
+    """释放一次对共享LLM实例的引用，引用数归零时从池中移除"""
+    if instance is None:
+        return
+    with _shared_instances_lock:
+        for cache_key, entry in _shared_instances.items():
+            if entry[0] is instance:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del _shared_instances[cache_key]
+                return
@@ -0,0 +1,67 @@
+"""
+大模型回复缓存：同一设备在相同上下文中重复提问时，直接复用上次的回复，跳过大模型调用
+"""
+
+import json
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from core.utils.dialogue import Dialogue
+from core.utils.util import remove_punctuation_and_length
+from core.utils.cache.manager import cache_manager, CacheType
+
+
+def build_cache_key(
+    device_id: str,
+    llm_name: str,
+    dialogue: Dialogue,
+    query: str,
+    memory_str: Optional[str] = None,
+) -> Optional[str]:
+    """
+    生成回复缓存键
+    提问去除标点、空格并转为小写后参与计算，同时带上设备ID、所用大模型、系统提示词和上一轮助手回复，
+    避免不同设备之间、切换模型或角色后、以及不同上下文中的追问互相命中；
+    回复还依赖本轮的记忆和当前时间，记忆内容与精确到分钟的时间也参与计算，记忆更新或时间变化后不再复用旧回复
+    Returns:
+        缓存键，提问为空时返回 None
+    """
+    _, normalized_query = remove_punctuation_and_length(query or "")
+    if not normalized_query:
+        return None
+
+    system_prompt = ""
+    previous_reply = ""
+    for message in dialogue.dialogue:
+        if message.role == "system":
+            system_prompt = message.content or ""
+            break
+    for message in reversed(dialogue.dialogue):
+        if message.role == "assistant" and message.content:
+            previous_reply = message.content
+            break
+
+    payload = json.dumps(
+        [
+            device_id,
+            llm_name,
+            system_prompt,
+            previous_reply,
+            memory_str or "",
+            datetime.now().strftime("%Y-%m-%d %H:%M"),
+            normalized_query.lower(),
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_response(cache_key: str) -> Optional[str]:
+    """获取缓存的回复，未命中时返回 None"""
+    return cache_manager.get(CacheType.LLM_RESPONSE, cache_key)
+
+
+def set_response(cache_key: str, response: str) -> None:
+    """缓存完整的回复文本"""
+    cache_manager.set(CacheType.LLM_RESPONSE, cache_key, response)
@@ -1,11 +1,24 @@
 from typing import Dict, Any
 from config.logger import setup_logging
 from core.utils import tts, llm, intent, memory, vad, asr
+from core.utils.util import parse_bool
 
 TAG = __name__
 logger = setup_logging()
 
 
+def _resolve_module(config: Dict[str, Any], module_name: str):
+    """解析选中的模块，只查一次字典，返回 (模块名, 模块配置, 模块类型)"""
+    select_module = config["selected_module"][module_name]
+    module_config = config[module_name][select_module]
+    return select_module, module_config, module_config.get("type", select_module)
+
+
+def _delete_audio_enabled(config: Dict[str, Any]) -> bool:
+    """解析是否删除音频文件的配置"""
+    return parse_bool(config.get("delete_audio", True))
+
+
 def initialize_modules(
     logger,
     config: Dict[str, Any],
@@ -35,58 +48,46 @@ def initialize_modules(
 
     # 初始化LLM模块
     if init_llm:
-        select_llm_module = config["selected_module"]["LLM"]
-        llm_type = (
-            select_llm_module
-            if "type" not in config["LLM"][select_llm_module]
-            else config["LLM"][select_llm_module]["type"]
+        select_llm_module, llm_config, llm_type = _resolve_module(
+            config, "LLM"
         )
-        modules["llm"] = llm.create_instance(
+        modules["llm"] = llm.create_shared_instance(
             llm_type,
-            config["LLM"][select_llm_module],
+            llm_config,
         )
         logger.bind(tag=TAG).info(f"初始化组件: llm成功 {select_llm_module}")
 
     # 初始化Intent模块
     if init_intent:
-        select_intent_module = config["selected_module"]["Intent"]
-        intent_type = (
-            select_intent_module
-            if "type" not in config["Intent"][select_intent_module]
-            else config["Intent"][select_intent_module]["type"]
+        select_intent_module, intent_config, intent_type = _resolve_module(
+            config, "Intent"
         )
         modules["intent"] = intent.create_instance(
             intent_type,
-            config["Intent"][select_intent_module],
+            intent_config,
         )
         logger.bind(tag=TAG).info(f"初始化组件: intent成功 {select_intent_module}")
 
     # 初始化Memory模块
     if init_memory:
-        select_memory_module = config["selected_module"]["Memory"]
-        memory_type = (
-            select_memory_module
-            if "type" not in config["Memory"][select_memory_module]
-            else config["Memory"][select_memory_module]["type"]
+        select_memory_module, memory_config, memory_type = _resolve_module(
+            config, "Memory"
         )
         modules["memory"] = memory.create_instance(
             memory_type,
-            config["Memory"][select_memory_module],
+            memory_config,
             config.get("summaryMemory", None),
         )
         logger.bind(tag=TAG).info(f"初始化组件: memory成功 {select_memory_module}")
 
     # 初始化VAD模块
     if init_vad:
-        select_vad_module = config["selected_module"]["VAD"]
-        vad_type = (
-            select_vad_module
-            if "type" not in config["VAD"][select_vad_module]
-            else config["VAD"][select_vad_module]["type"]
+        select_vad_module, vad_config, vad_type = _resolve_module(
+            config, "VAD"
         )
         modules["vad"] = vad.create_instance(
             vad_type,
-            config["VAD"][select_vad_module],
+            vad_config,
         )
         logger.bind(tag=TAG).info(f"初始化组件: vad成功 {select_vad_module}")
 
@@ -99,33 +100,23 @@ def initialize_modules(
 
 
 def initialize_tts(config):
-    select_tts_module = config["selected_module"]["TTS"]
-    tts_type = (
-        select_tts_module
-        if "type" not in config["TTS"][select_tts_module]
-        else config["TTS"][select_tts_module]["type"]
-    )
+    _, tts_config, tts_type = _resolve_module(config, "TTS")
     new_tts = tts.create_instance(
         tts_type,
-        config["TTS"][select_tts_module],
-        str(config.get("delete_audio", True)).lower() in ("true", "1", "yes"),
+        tts_config,
+        _delete_audio_enabled(config),
     )
     return new_tts
 
 
 def initialize_asr(config):
-    select_asr_module = config["selected_module"]["ASR"]
-    asr_type = (
-        select_asr_module
-        if "type" not in config["ASR"][select_asr_module]
-        else config["ASR"][select_asr_module]["type"]
-    )
+    _, asr_config, asr_type = _resolve_module(config, "ASR")
     new_asr = asr.create_instance(
         asr_type,
-        config["ASR"][select_asr_module],
-        str(config.get("delete_audio", True)).lower() in ("true", "1", "yes"),
+        asr_config,
+        _delete_audio_enabled(config),
     )
-    logger.bind(tag=TAG).info("ASR模块初始化完成")
+    logger.bind(tag=TAG).debug("ASR模块初始化完成")
     return new_asr
 
 
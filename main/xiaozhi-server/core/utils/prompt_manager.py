@@ -124,7 +124,8 @@ class PromptManager:
             self.cache_manager.set(self.CacheType.DEVICE_PROMPT, device_cache_key, user_prompt)
             self.logger.bind(tag=TAG).debug(f"设备 {device_id} 的提示词已缓存")
 
-        self.logger.bind(tag=TAG).info(f"使用快速提示词: {user_prompt[:50]}...")
+        # 每个连接都会走到这里，使用debug级别并交由日志库按需格式化
+        self.logger.bind(tag=TAG).debug("使用快速提示词: {}...", user_prompt[:50])
         return user_prompt
 
     def _get_current_time_info(self) -> tuple:
@@ -305,8 +306,8 @@ class PromptManager:
             self.cache_manager.set(
                 self.CacheType.DEVICE_PROMPT, device_cache_key, enhanced_prompt
             )
-            self.logger.bind(tag=TAG).info(
-                f"构建增强提示词成功，长度: {len(enhanced_prompt)}"
+            self.logger.bind(tag=TAG).debug(
+                "构建增强提示词成功，长度: {}", len(enhanced_prompt)
             )
             return enhanced_prompt
 
@@ -0,0 +1,41 @@
+"""
+提供者类加载工具，供各模块的 create_instance 工厂方法共用
+"""
+
+import os
+import sys
+import importlib
+
+# (模块包, 类型名) -> 提供者类，解析一次后复用，避免每次创建实例都检查文件并查找模块
+_provider_classes = {}
+
+
+def load_provider_class(package: str, class_name: str, provider_attr: str, nested=False):
+    """
+    加载 core.providers.<package> 下的提供者类
+    Args:
+        package: 提供者所在的包名，如 "tts"、"asr"
+        class_name: 配置中的类型名
+        provider_attr: 模块中提供者类的名称，如 "TTSProvider"
+        nested: 提供者是否位于同名子目录中（core/providers/<package>/<name>/<name>.py）
+    Returns:
+        提供者类，类型不存在时返回 None
+    """
+    cache_key = (package, class_name)
+    provider_class = _provider_classes.get(cache_key)
+    if provider_class is not None:
+        return provider_class
+
+    if nested:
+        file_path = os.path.join("core", "providers", package, class_name, f"{class_name}.py")
+        lib_name = f"core.providers.{package}.{class_name}.{class_name}"
+    else:
+        file_path = os.path.join("core", "providers", package, f"{class_name}.py")
+        lib_name = f"core.providers.{package}.{class_name}"
+    if not os.path.exists(file_path):
+        return None
+
+    module = sys.modules.get(lib_name) or importlib.import_module(lib_name)
+    provider_class = getattr(module, provider_attr)
+    _provider_classes[cache_key] = provider_class
+    return provider_class
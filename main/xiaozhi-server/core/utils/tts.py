@@ -1,9 +1,7 @@
-import os
 import re
-import sys
-import importlib
 
 from config.logger import setup_logging
+from core.utils.provider_loader import load_provider_class
 from core.utils.textUtils import check_emoji
 
 logger = setup_logging()
@@ -32,13 +30,10 @@ punctuation_set = {
 
 def create_instance(class_name, *args, **kwargs):
     # 创建TTS实例
-    if os.path.exists(os.path.join('core', 'providers', 'tts', f'{class_name}.py')):
-        lib_name = f'core.providers.tts.{class_name}'
-        if lib_name not in sys.modules:
-            sys.modules[lib_name] = importlib.import_module(f'{lib_name}')
-        return sys.modules[lib_name].TTSProvider(*args, **kwargs)
-
-    raise ValueError(f"不支持的TTS类型: {class_name}，请检查该配置的type是否设置正确")
+    provider_class = load_provider_class("tts", class_name, "TTSProvider")
+    if provider_class is None:
+        raise ValueError(f"不支持的TTS类型: {class_name}，请检查该配置的type是否设置正确")
+    return provider_class(*args, **kwargs)
 
 
 class MarkdownCleaner:
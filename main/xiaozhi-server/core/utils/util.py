@@ -1,7 +1,6 @@
 import re
 import os
 import json
-import copy
 import wave
 import socket
 import asyncio
@@ -154,6 +153,23 @@ def parse_string_to_list(value, separator=";"):
     return []
 
 
+_TRUE_STRINGS = frozenset(("true", "1", "yes"))
+
+
+def parse_bool(value) -> bool:
+    """
+    将配置值转换为布尔值
+    Args:
+        value: 输入值，可以是布尔值、数字或 "true"/"1"/"yes" 等字符串
+    Returns:
+        bool: 处理后的布尔值
+    """
+    # 配置中大多已是布尔值，直接返回，避免字符串转换
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in _TRUE_STRINGS
+
+
 def check_ffmpeg_installed() -> bool:
     """
     检查当前环境中是否已正确安装并可执行 ffmpeg。
@@ -324,6 +340,32 @@ async def audio_to_data(
     return result
 
 
+# 绑定提示、超长提示等静态提示音，文件内容不会变化，解码结果常驻内存，不随缓存过期重复解码
+STATIC_AUDIO_ASSETS = (
+    "config/assets/bind_code.wav",
+    "config/assets/bind_not_found.wav",
+    "config/assets/max_output_size.wav",
+) + tuple(f"config/assets/bind_code/{digit}.wav" for digit in "0123456789")
+_static_audio_data = {}
+
+
+async def static_audio_to_data(audio_file_path: str) -> list[bytes]:
+    """获取静态提示音的Opus帧列表，首次使用时解码，之后直接复用"""
+    datas = _static_audio_data.get(audio_file_path)
+    if datas is None:
+        datas = await audio_to_data(audio_file_path, use_cache=False)
+        _static_audio_data[audio_file_path] = datas
+    return datas
+
+
+async def preload_static_audio():
+    """预先解码全部静态提示音，使首次绑定提示无需等待解码，失败的文件留到使用时再加载"""
+    await asyncio.gather(
+        *(static_audio_to_data(path) for path in STATIC_AUDIO_ASSETS),
+        return_exceptions=True,
+    )
+
+
 def audio_bytes_to_data_stream(
     audio_bytes, file_type, is_opus, callback: Callable[[Any], Any], sample_rate=16000, opus_encoder=None
 ) -> None:
@@ -516,7 +558,8 @@ def filter_sensitive_info(config: dict) -> dict:
                 filtered[k] = v
         return filtered
 
-    return _filter_dict(copy.deepcopy(config))
+    # _filter_dict 逐层构建新字典，不会修改原配置，无需先深拷贝
+    return _filter_dict(config)
 
 
 def get_vision_url(config: dict) -> str:
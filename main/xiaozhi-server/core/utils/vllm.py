@@ -7,17 +7,14 @@ project_root = os.path.abspath(os.path.join(current_dir, "..", ".."))
 sys.path.insert(0, project_root)
 
 from config.logger import setup_logging
-import importlib
+from core.utils.provider_loader import load_provider_class
 
 logger = setup_logging()
 
 
 def create_instance(class_name, *args, **kwargs):
     # 创建LLM实例
-    if os.path.exists(os.path.join("core", "providers", "vllm", f"{class_name}.py")):
-        lib_name = f"core.providers.vllm.{class_name}"
-        if lib_name not in sys.modules:
-            sys.modules[lib_name] = importlib.import_module(f"{lib_name}")
-        return sys.modules[lib_name].VLLMProvider(*args, **kwargs)
-
-    raise ValueError(f"不支持的VLLM类型: {class_name}，请检查该配置的type是否设置正确")
+    provider_class = load_provider_class("vllm", class_name, "VLLMProvider")
+    if provider_class is None:
+        raise ValueError(f"不支持的VLLM类型: {class_name}，请检查该配置的type是否设置正确")
+    return provider_class(*args, **kwargs)
@@ -34,7 +34,8 @@ from core.connection import ConnectionHandler
 from config.config_loader import get_config_from_api_async
 from core.auth import AuthManager, AuthenticationError
 from core.utils.modules_initialize import initialize_modules
-from core.utils.util import check_vad_update, check_asr_update
+from core.utils.llm import release_shared_instance
+from core.utils.util import check_vad_update, check_asr_update, preload_static_audio
 
 TAG = __name__
 
@@ -44,26 +45,27 @@ class WebSocketServer:
         self.config = config
         self.logger = setup_logging(config)
         self.config_lock = asyncio.Lock()
+        selected_module = self.config["selected_module"]
         modules = initialize_modules(
             self.logger,
             self.config,
-            "VAD" in self.config["selected_module"],
-            "ASR" in self.config["selected_module"],
-            "LLM" in self.config["selected_module"],
+            "VAD" in selected_module,
+            "ASR" in selected_module,
+            "LLM" in selected_module,
             False,
-            "Memory" in self.config["selected_module"],
-            "Intent" in self.config["selected_module"],
+            "Memory" in selected_module,
+            "Intent" in selected_module,
         )
-        self._vad = modules["vad"] if "vad" in modules else None
-        self._asr = modules["asr"] if "asr" in modules else None
-        self._llm = modules["llm"] if "llm" in modules else None
-        self._intent = modules["intent"] if "intent" in modules else None
-        self._memory = modules["memory"] if "memory" in modules else None
+        self._vad = modules.get("vad")
+        self._asr = modules.get("asr")
+        self._llm = modules.get("llm")
+        self._intent = modules.get("intent")
+        self._memory = modules.get("memory")
 
         auth_config = self.config["server"].get("auth", {})
         self.auth_enable = auth_config.get("enabled", False)
         # 设备白名单
-        self.allowed_devices = set(auth_config.get("allowed_devices", []))
+        self.allowed_devices = frozenset(auth_config.get("allowed_devices", []))
         secret_key = self.config["server"]["auth_key"]
         expire_seconds = auth_config.get("expire_seconds", None)
         self.auth = AuthManager(secret_key=secret_key, expire_seconds=expire_seconds)
@@ -73,14 +75,16 @@ class WebSocketServer:
         host = server_config.get("ip", "0.0.0.0")
         port = int(server_config.get("port", 8000))
 
+        # 后台预热静态提示音，避免首次绑定提示时现场解码
+        self._preload_task = asyncio.create_task(preload_static_audio())
+
         async with websockets.serve(
             self._handle_connection, host, port, process_request=self._http_response
         ):
             await asyncio.Future()
 
     async def _handle_connection(self, websocket: websockets.ServerConnection):
-        headers = dict(websocket.request.headers)
-        if headers.get("device-id", None) is None:
+        if websocket.request.headers.get("device-id") is None:
             # 尝试从 URL 的查询参数中获取 device-id
             from urllib.parse import parse_qs, urlparse
 
@@ -186,17 +190,13 @@ class WebSocketServer:
                     "Intent" in new_config["selected_module"],
                 )
 
-                # 更新组件实例
-                if "vad" in modules:
-                    self._vad = modules["vad"]
-                if "asr" in modules:
-                    self._asr = modules["asr"]
+                # 更新组件实例，旧的共享LLM实例释放引用，仍在使用它的连接不受影响
+                old_llm = self._llm
+                for name in ("vad", "asr", "llm", "intent", "memory"):
+                    if name in modules:
+                        setattr(self, f"_{name}", modules[name])
                 if "llm" in modules:
-                    self._llm = modules["llm"]
-                if "intent" in modules:
-                    self._intent = modules["intent"]
-                if "memory" in modules:
-                    self._memory = modules["memory"]
+                    release_shared_instance(old_llm)
                 self.logger.bind(tag=TAG).info(f"更新配置任务执行完毕")
                 return True
         except Exception as e:
@@ -206,7 +206,8 @@ class WebSocketServer:
     async def _handle_auth(self, websocket: websockets.ServerConnection):
         # 先认证，后建立连接
         if self.auth_enable:
-            headers = dict(websocket.request.headers)
+            # 直接在Headers对象上查找（大小写不敏感），避免复制全部请求头
+            headers = websocket.request.headers
             device_id = headers.get("device-id", None)
             client_id = headers.get("client-id", None)
             if self.allowed_devices and device_id in self.allowed_devices:
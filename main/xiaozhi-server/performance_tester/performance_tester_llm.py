@@ -9,7 +9,7 @@ import yaml
 import aiohttp
 from tabulate import tabulate
 from core.utils.llm import create_instance as create_llm_instance
-from config.settings import load_config
+from config.config_loader import load_config_sync
 
 # 设置全局日志级别为 WARNING，抑制 INFO 级别日志
 logging.basicConfig(level=logging.WARNING)
@@ -19,7 +19,7 @@ description = "大语言模型性能测试"
 
 class LLMPerformanceTester:
     def __init__(self):
-        self.config = load_config()
+        self.config = load_config_sync()
         # 使用更符合智能体场景的测试内容，包含系统提示词
         self.system_prompt = self._load_system_prompt()
         self.test_sentences = self.config.get("module_test", {}).get(
@@ -8,7 +8,7 @@ import gzip
 import random
 from urllib import parse
 from tabulate import tabulate
-from config.settings import load_config
+from config.config_loader import load_config_sync
 import tempfile
 import wave
 import hmac
@@ -25,7 +25,7 @@ except ImportError:
 
 class BaseASRTester:
     def __init__(self, config_key: str):
-        self.config = load_config()
+        self.config = load_config_sync()
         self.config_key = config_key
         self.asr_config = self.config.get("ASR", {}).get(config_key, {})
         self.test_audio_files = self._load_test_audio_files()
@@ -10,12 +10,12 @@ import hashlib
 import asyncio
 from urllib.parse import urlparse, urlencode
 from tabulate import tabulate
-from config.settings import load_config
+from config.config_loader import load_config_sync
 
 description = "流式TTS语音合成首词耗时测试"
 class StreamTTSPerformanceTester:
     def __init__(self):
-        self.config = load_config()
+        self.config = load_config_sync()
         self.test_texts = [
             "你好，这是一句话。"
         ]
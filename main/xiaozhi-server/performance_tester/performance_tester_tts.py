@@ -9,7 +9,7 @@ from tabulate import tabulate
 
 # 确保从 core.utils.tts 导入 create_tts_instance
 from core.utils.tts import create_instance as create_tts_instance
-from config.settings import load_config
+from config.config_loader import load_config_sync
 
 # 设置全局日志级别为 WARNING
 logging.basicConfig(level=logging.WARNING)
@@ -19,7 +19,7 @@ description = "非流式语音合成性能测试"
 
 class TTSPerformanceTester:
     def __init__(self):
-        self.config = load_config()
+        self.config = load_config_sync()
         self.test_sentences = self.config.get("module_test", {}).get(
             "test_sentences",
             [
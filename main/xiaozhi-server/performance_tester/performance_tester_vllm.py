@@ -6,7 +6,7 @@ import base64
 from typing import Dict
 from tabulate import tabulate
 from core.utils.vllm import create_instance
-from config.settings import load_config
+from config.config_loader import load_config_sync
 
 # 设置全局日志级别为WARNING，抑制INFO级别日志
 logging.basicConfig(level=logging.WARNING)
@@ -16,7 +16,7 @@ description = "视觉识别模型性能测试"
 
 class AsyncVisionPerformanceTester:
     def __init__(self):
-        self.config = load_config()
+        self.config = load_config_sync()
 
         self.test_images = [
             "../../docs/images/demo1.png",
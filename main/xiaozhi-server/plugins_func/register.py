@@ -72,8 +72,7 @@ class DeviceTypeRegistry:
 
     def register_device_type(self, type_id, functions):
         """注册设备类型及其函数"""
-        if type_id not in self.type_functions:
-            self.type_functions[type_id] = functions
+        self.type_functions.setdefault(type_id, functions)
 
 
 # 初始化函数注册字典
@@ -104,7 +103,7 @@ def register_device_function(name, desc, type=None):
 class FunctionRegistry:
     def __init__(self):
         self.function_registry = {}
-        self.logger = setup_logging()
+        self.logger = logger
 
     def register_function(self, name, func_item=None):
         # 如果提供了func_item，直接注册